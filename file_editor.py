@@ -22,6 +22,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -529,6 +535,15 @@ class FileEditor:
     @staticmethod
     def _validate_json(content: str) -> FileResult:
         """Validate JSON syntax."""
+        if HAS_ORJSON:
+            # Fast path for the common valid case. orjson is stricter than
+            # json (NaN, huge ints), so anything it rejects is re-checked
+            # below, which also gives json's line/column error message.
+            try:
+                orjson.loads(content)
+                return FileResult.ok("JSON is valid")
+            except orjson.JSONDecodeError:
+                pass
         try:
             json.loads(content)
             return FileResult.ok("JSON is valid")
@@ -204,7 +204,8 @@ class MinecraftServerManagerApp(App):
         build_editor(self.query_one("#tab-editor", TabPane), self)
         build_eula(self.query_one("#tab-eula", TabPane), self)
 
-        # Start periodic refresh
+        # Start periodic refresh (status bar looked up once, not per tick)
+        self._status_bar = self.query_one("#app-status-bar", StatusBar)
         self.set_interval(2.0, self._refresh_status)
         self._refresh_status()
 
@@ -214,7 +215,7 @@ class MinecraftServerManagerApp(App):
         """Update the status bar and dashboard stats."""
         try:
             status = self.server_manager.get_server_status()
-            bar = self.query_one("#app-status-bar", StatusBar)
+            bar = self._status_bar
             bar.server_running = status.running
             bar.mc_ver = status.version or self.server_manager.get_server_config().get("version", "?")
             bar.players = f"{status.players_online}/{status.max_players or 20}"
@@ -235,14 +236,21 @@ class MinecraftServerManagerApp(App):
 
     def action_create_backup(self) -> None:
         try:
-            result = self.server_manager.create_backup()
-            if isinstance(result, tuple):
-                ok, msg = result
-            else:
-                ok, msg = result.success, result.message
-            self.notify(msg, severity="information" if ok else "error")
+            token = self.server_manager.start_backup()
         except Exception as exc:
             self.notify(f"Backup failed: {exc}", severity="error")
+            return
+        self.notify("💾 Backup started…")
+
+        # Zipping runs on a worker thread; check back until it's done
+        def _poll() -> None:
+            result = self.server_manager.get_backup_status(token)
+            if not result.details.get("done", True):
+                return
+            timer.stop()
+            self.notify(result.message, severity="information" if result.success else "error")
+
+        timer = self.set_interval(1.0, _poll)
 
     # ── Helpers for tabs ───────────────────────
 
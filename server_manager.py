@@ -20,21 +20,29 @@ Responsibilities:
 from __future__ import annotations
 
 import asyncio
+import bisect
 import json
 import logging
+import mmap
 import os
 import platform
 import re
-import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
+import uuid
+import zipfile
 from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
 import aiohttp
 import psutil
@@ -46,6 +54,70 @@ from file_editor import FileEditor
 
 logger = logging.getLogger(__name__)
 
+# Host OS, resolved once per process
+_SYSTEM = platform.system()  # Windows | Linux | Darwin
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# One "key=value" per line; blank lines and "#" comments never match
+_PROP_RE = re.compile(rb"(?m)^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$")
+
+# Status lines scraped from raw server output; the named group says which
+# one. No branch may cross a newline, since it runs over whole chunks.
+_STATUS_RE = re.compile(
+    rb"(?P<join>\w+) joined the game"
+    rb"|(?P<leave>\w+) left the game"
+    rb"|TPS from last[^:\n]*:[ \t]*(?P<tps>[\d.]+)"
+)
+
+# Whole whitespace-delimited tokens that neither start with "-" nor
+# contain "=", i.e. the ones set_jvm_flags rejects
+_BAD_JVM_TOKEN_RE = re.compile(r"(?<!\S)([^-=\s][^=\s]*)(?!\S)")
+
+_BOOL_STR = {True: "true", False: "false"}
+
+
+def _prop_bool(value: Any) -> str:
+    """Render a config value the way server.properties spells booleans."""
+    if value is True or value is False:
+        return _BOOL_STR[value]
+    return str(value).lower()
+
+
+# How long get_server_status / get_system_resources results are reused
+STATUS_CACHE_TTL = 0.5
+
+
+def _ttl_cached(ttl: float) -> Callable:
+    """
+    Memoize a no-argument method per instance for *ttl* seconds.
+
+    Values live in the instance's ``_ttl_cache`` dict under the method
+    name, so ``bust_cache()`` can drop them all at once. Callers share
+    the returned object and must treat it as read-only.
+    """
+    def decorator(method: Callable) -> Callable:
+        name = method.__name__
+
+        @wraps(method)
+        def wrapper(self):
+            now = time.monotonic()
+            hit = self._ttl_cache.get(name)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            value = method(self)
+            self._ttl_cache[name] = (now + ttl, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=16)
+def split_jvm_flags(flags: str) -> Tuple[str, ...]:
+    """Tokenize a JVM flags string once; repeat lookups hit the cache."""
+    return tuple(flags.split())
+
 
 # ──────────────────────────────────────────────
 #  Environment Detection
@@ -58,8 +130,16 @@ class Environment:
     COLAB = "colab"
     IDX = "idx"
 
+    # Detected once at import time (see bottom of this section)
+    CURRENT = LOCAL
+
     @staticmethod
     def detect() -> str:
+        """Return the runtime environment detected at import time."""
+        return Environment.CURRENT
+
+    @staticmethod
+    def _probe() -> str:
         """Auto-detect the runtime environment."""
         # Google Colab
         if os.path.exists("/content") and "COLAB_RELEASE_TAG" in os.environ:
@@ -77,11 +157,206 @@ class Environment:
         return Environment.LOCAL
 
 
+Environment.CURRENT = Environment._probe()
+
+
+# ──────────────────────────────────────────────
+#  Log Buffer
+# ──────────────────────────────────────────────
+
+# Level ids stored alongside every buffered line; index into LOG_LEVEL_TAGS
+LOG_PLAIN, LOG_INFO, LOG_WARNING, LOG_ERROR = range(4)
+LOG_LEVEL_TAGS: Tuple[str, ...] = ("plain", "info", "warning", "error")
+
+_LEVEL_RE = re.compile(rb"\b(INFO|WARN(?:ING)?|ERROR|FATAL|SEVERE)\b")
+_LEVEL_IDS: Dict[bytes, int] = {
+    b"INFO":    LOG_INFO,
+    b"WARN":    LOG_WARNING,
+    b"WARNING": LOG_WARNING,
+    b"ERROR":   LOG_ERROR,
+    b"FATAL":   LOG_ERROR,
+    b"SEVERE":  LOG_ERROR,
+}
+
+
+def classify_log_line(raw: bytes) -> int:
+    """Return the level id of a raw (undecoded) log line."""
+    m = _LEVEL_RE.search(raw)
+    return _LEVEL_IDS[m.group(1)] if m else LOG_PLAIN
+
+
+def tail_file(path: str | Path, n: int) -> List[str]:
+    """
+    Return the last *n* lines of a text file.
+
+    The file is memory-mapped and the start of the tail is found by
+    walking back n+1 newlines with rfind(), so only the tail itself is
+    copied and decoded however long the file is.
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    if n <= 0:
+        return []
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            return []  # mmap refuses empty files
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = size
+            # One extra newline guarantees the first kept line is whole
+            for _ in range(n + 1):
+                pos = mm.rfind(b"\n", 0, pos)
+                if pos < 0:
+                    break
+            data = mm[pos + 1:]
+    return data.decode("utf-8", errors="replace").splitlines()[-n:]
+
+
+class LogBuffer:
+    """
+    Bounded in-memory buffer of recent server output.
+
+    Raw line bytes are written into a preallocated circular bytearray; a
+    deque of ``(offset, level_id)`` records where each line starts and how
+    it was classified, so readers never have to re-scan a line to colour it.
+    Offsets are absolute (bytes written since creation), so a line's
+    position in the ring is ``offset % max_bytes``.
+
+    The server's reader thread writes while the UI and log_stream read, so
+    every method that touches the ring or the records holds ``_lock``.
+
+    Args:
+        max_lines: Maximum number of lines kept
+        max_bytes: Maximum number of bytes kept
+    """
+
+    def __init__(self, max_lines: int = 5000, max_bytes: int = 4 * 1024 * 1024) -> None:
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self._ring = bytearray(max_bytes)
+        self._end = 0  # absolute offset one past the last byte written
+        self._lines: deque[Tuple[int, int]] = deque(maxlen=max_lines)
+        self._pending = b""  # trailing partial line from feed()
+        # Reentrant: feed() appends and flush() feeds under the same lock
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __iter__(self):
+        return iter(self.tail(len(self._lines)))
+
+    def clear(self) -> None:
+        """Drop all buffered lines."""
+        with self._lock:
+            self._lines.clear()
+            self._pending = b""
+
+    def append(self, raw: bytes) -> int:
+        """
+        Append one raw line (without its newline).
+
+        Returns:
+            The level id the line was classified as
+        """
+        level = classify_log_line(raw)
+        # A single line can't be longer than the ring itself
+        raw = raw[: self.max_bytes - 1] + b"\n"
+        with self._lock:
+            start = self._end
+            self._write(start, raw)
+            self._end = start + len(raw)
+            self._lines.append((start, level))
+            # Forget lines whose bytes have just been overwritten
+            floor = self._end - self.max_bytes
+            while self._lines[0][0] < floor:
+                self._lines.popleft()
+        return level
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        Append a raw chunk of output that may start or end mid-line.
+
+        Complete lines are appended; a trailing partial line is held back
+        until the chunk that completes it arrives.
+
+        Returns:
+            The newline-terminated block of lines this call appended
+        """
+        with self._lock:
+            data = self._pending + chunk
+            cut = data.rfind(b"\n") + 1
+            block, self._pending = data[:cut], data[cut:]
+            for raw in block.split(b"\n")[:-1]:
+                # Only the \r of a CRLF; trailing spaces are line content
+                self.append(raw.rstrip(b"\r"))
+        return block
+
+    def flush(self) -> bytes:
+        """Append any held-back partial line as a line of its own."""
+        with self._lock:
+            return self.feed(b"\n") if self._pending else b""
+
+    def _write(self, pos: int, data: bytes) -> None:
+        """Copy *data* into the ring at absolute offset *pos*, wrapping."""
+        cap = self.max_bytes
+        i = pos % cap
+        first = min(len(data), cap - i)
+        view = memoryview(data)
+        self._ring[i:i + first] = view[:first]
+        if first < len(data):
+            self._ring[:len(data) - first] = view[first:]
+
+    def _read(self, start: int, stop: int) -> bytes:
+        """Return the bytes between absolute offsets *start* and *stop*."""
+        cap = self.max_bytes
+        i = start % cap
+        size = stop - start
+        if i + size <= cap:
+            return bytes(self._ring[i:i + size])
+        return bytes(self._ring[i:]) + bytes(self._ring[:size - (cap - i)])
+
+    def tail(self, n: int) -> List[str]:
+        """
+        Return the last *n* lines, decoded.
+
+        The start offset of the n-th last line is looked up directly, so the
+        whole tail is copied out of the ring (at most two slices) and decoded
+        in one call.
+        """
+        with self._lock:
+            raw = self._read_tail(n)
+        if raw is None:
+            return []
+        return raw.decode("utf-8", errors="replace").split("\n")
+
+    def tail_entries(self, n: int) -> List[Tuple[str, int]]:
+        """Return the last *n* lines as ``(line, level_id)`` pairs."""
+        with self._lock:
+            raw = self._read_tail(n)
+            if raw is None:
+                return []
+            # Walk back from the newest record so only n are touched
+            recent = list(islice(reversed(self._lines), n))
+        recent.reverse()
+        lines = raw.decode("utf-8", errors="replace").split("\n")
+        return [(line, level) for line, (_, level) in zip(lines, recent)]
+
+    def _read_tail(self, n: int) -> Optional[bytes]:
+        """Copy the last *n* lines out of the ring (caller holds _lock)."""
+        if n <= 0 or not self._lines:
+            return None
+        start = self._lines[-min(n, len(self._lines))][0]
+        # Drop the final newline so split() doesn't yield a trailing ""
+        return self._read(start, self._end - 1)
+
+
 # ──────────────────────────────────────────────
 #  Result Object
 # ──────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """Unified result object for all ServerManager operations."""
 
@@ -105,7 +380,7 @@ class Result:
 #  Server Status
 # ──────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ServerStatus:
     """Snapshot of current server state."""
 
@@ -126,23 +401,24 @@ class ServerStatus:
     port: int = 25565
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "running": self.running,
-            "pid": self.pid,
-            "uptime_seconds": round(self.uptime_seconds, 1),
-            "cpu_percent": round(self.cpu_percent, 1),
-            "ram_used_mb": round(self.ram_used_mb, 1),
-            "ram_allocated_mb": self.ram_allocated_mb,
-            "players_online": self.players_online,
-            "max_players": self.max_players,
-            "player_names": self.player_names,
-            "version": self.version,
-            "server_type": self.server_type,
-            "tps": round(self.tps, 1),
-            "motd": self.motd,
-            "world_name": self.world_name,
-            "port": self.port,
-        }
+        result = {name: getattr(self, name) for name in _STATUS_FIELDS}
+        for name, digits in _STATUS_ROUND.items():
+            result[name] = round(result[name], digits)
+        return result
+
+
+# Field order of ServerStatus.to_dict() and the float fields it rounds
+_STATUS_FIELDS: Tuple[str, ...] = (
+    "running", "pid", "uptime_seconds", "cpu_percent", "ram_used_mb",
+    "ram_allocated_mb", "players_online", "max_players", "player_names",
+    "version", "server_type", "tps", "motd", "world_name", "port",
+)
+_STATUS_ROUND: Dict[str, int] = {
+    "uptime_seconds": 1,
+    "cpu_percent": 1,
+    "ram_used_mb": 1,
+    "tps": 1,
+}
 
 
 # ──────────────────────────────────────────────
@@ -164,15 +440,24 @@ class ServerManager:
     # ── Graceful stop timeout (seconds) ──
     STOP_TIMEOUT = 30
 
-    # ── Log colour tags used internally ──
-    LOG_LEVELS = {
-        "INFO":    "info",
-        "WARN":    "warning",
-        "WARNING": "warning",
-        "ERROR":   "error",
-        "FATAL":   "error",
-        "SEVERE":  "error",
-    }
+    # ── How long to wait for a force-killed process to exit (seconds) ──
+    KILL_TIMEOUT = 5
+
+    # ── How long a finished backup job stays pollable (seconds) ──
+    BACKUP_JOB_TTL = 300
+
+    # ── World files that are already compressed; stored as-is in backups ──
+    _STORED_SUFFIXES = frozenset({
+        ".mca", ".mcc", ".mcr", ".dat", ".dat_old", ".nbt",
+        ".gz", ".zip", ".jar", ".png",
+    })
+
+    # ── Host OS (Windows | Linux | Darwin) ──
+    _system = _SYSTEM
+
+    # ── Constant for the life of the process ──
+    _cpu_count = psutil.cpu_count()
+    _python_version = platform.python_version()
 
     # ================================================================
     #  INITIALIZATION
@@ -185,6 +470,8 @@ class ServerManager:
     ) -> None:
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
+        self._config_batch_depth = 0
+        self._config_dirty = False
         self._load_config()
 
         # Paths (can be overridden via constructor or config)
@@ -199,6 +486,15 @@ class ServerManager:
             self.config.get("paths", {}).get("backup_dir", "./backups")
         )
         self.logs_dir = self.server_dir / "logs"
+        # Volume reported by get_system_resources and the directory whose
+        # free space check_prerequisites measures; resolved once
+        server_dir_abs = self.server_dir.resolve()
+        self._disk_probe_path = (
+            server_dir_abs.drive + "\\" if _IS_WINDOWS else "/"
+        )
+        self._free_space_path = (
+            self._disk_probe_path if _IS_WINDOWS else str(server_dir_abs)
+        )
         java_dir = Path(
             self.config.get("paths", {}).get("java_dir", "./java")
         )
@@ -210,17 +506,42 @@ class ServerManager:
 
         # Process state
         self._process: Optional[subprocess.Popen] = None
+        self._psutil_proc: Optional[psutil.Process] = None
         self._start_time: Optional[float] = None
-        self._log_buffer: deque[str] = deque(maxlen=5000)
-        self._log_file_handle = None
+        self._log_buffer = LogBuffer(max_lines=5000)
+
+        # log_stream() consumers, called from the reader thread per block
+        # with that block's (line, level tag) entries
+        self._log_subscribers: List[Callable[[List[Tuple[str, str]]], None]] = []
+
+        # Short-lived results of the status/resource pollers (_ttl_cached)
+        self._ttl_cache: Dict[str, Tuple[float, Any]] = {}
+
+        # Live status, updated as output arrives (see _ingest_output)
+        self._players_online: set[str] = set()
+        # Same names kept sorted with bisect (insort / bisect_left + del)
+        self._player_names: List[str] = []
+        self._last_tps: Optional[float] = None
+
+        # Last all-clear from check_prerequisites:
+        # (resolved JAR/eula/config paths, their fingerprint, checks)
+        self._prereq_cache: Optional[
+            Tuple[tuple, tuple, Dict[str, Dict[str, Any]]]
+        ] = None
+
+        # Background backups (see start_backup)
+        self._backup_executor: Optional[ThreadPoolExecutor] = None
+        self._backup_jobs: Dict[str, Future] = {}
+        self._backup_finished: Dict[str, float] = {}  # token -> monotonic time
+
+        # Prime the system-wide CPU counter; get_system_resources reads
+        # the delta since the previous call without blocking.
+        psutil.cpu_percent(interval=None)
 
         # Environment
         self.environment = Environment.detect()
         logger.info("Environment detected: %s", self.environment)
 
-        # System info
-        self._system = platform.system()  # Windows | Linux | Darwin
-
         # Ensure directories
         for d in (self.server_dir, self.plugins_dir, self.backup_dir, self.logs_dir):
             d.mkdir(parents=True, exist_ok=True)
@@ -250,7 +571,18 @@ class ServerManager:
             self.config = {}
 
     def save_config(self) -> None:
-        """Persist self.config back to config.json."""
+        """
+        Persist self.config back to config.json.
+
+        Inside config_batch() the write is deferred to the end of the batch.
+        """
+        # Type and version feed the cached checks; config.json's mtime
+        # alone misses changes still pending in a batch
+        self._prereq_cache = None
+        if self._config_batch_depth:
+            self._config_dirty = True
+            return
+        self._config_dirty = False
         try:
             with open(self.config_path, "w", encoding="utf-8") as fh:
                 json.dump(self.config, fh, indent=2)
@@ -258,6 +590,24 @@ class ServerManager:
         except OSError as exc:
             logger.error("Failed to save config: %s", exc)
 
+    @contextmanager
+    def config_batch(self) -> Iterator[None]:
+        """
+        Coalesce config writes made inside the block into one save.
+
+        Example:
+            with sm.config_batch():
+                sm.update_config("server.ram", 4096)
+                sm.update_config("server.max_players", 50)
+        """
+        self._config_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._config_batch_depth -= 1
+            if not self._config_batch_depth and self._config_dirty:
+                self.save_config()
+
     def get_config(self) -> Dict[str, Any]:
         """Return the full configuration dictionary."""
         return dict(self.config)
@@ -307,14 +657,10 @@ class ServerManager:
             return props
 
         try:
-            content = props_path.read_text(encoding="utf-8")
-            for line in content.splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" in line:
-                    key, _, value = line.partition("=")
-                    props[key.strip()] = value.strip()
+            props = {
+                k.decode("utf-8", errors="replace"): v.decode("utf-8", errors="replace")
+                for k, v in _PROP_RE.findall(props_path.read_bytes())
+            }
             logger.debug("Parsed %d properties", len(props))
         except OSError as exc:
             logger.error("Failed to read server.properties: %s", exc)
@@ -414,11 +760,70 @@ class ServerManager:
         Returns:
             Result with details: {"checks": {name: {ok, message}}}
         """
+        java_bin = self.java_manager.get_java_binary()
+
+        # Java, JAR, EULA and compatibility only change when one of these
+        # files does, so a previous all-clear can be reused. The paths are
+        # resolved when the checks run; a hit only stats them.
+        cached = self._prereq_cache
+        if cached is not None and cached[1] == self._prereq_fingerprint(
+            java_bin, cached[0]
+        ):
+            checks = dict(cached[2])
+            all_ok = True
+        else:
+            jar = self.get_server_jar()
+            paths = (
+                jar.resolve() if jar else None,
+                self.eula_manager.eula_path.resolve(),
+                self.config_path.resolve(),
+            )
+            fingerprint = self._prereq_fingerprint(java_bin, paths)
+            checks, all_ok = self._check_static_prerequisites(java_bin, paths[0])
+            self._prereq_cache = (
+                (paths, fingerprint, dict(checks)) if all_ok else None
+            )
+
+        # 4. Disk space (cheap and volatile, always re-checked)
+        try:
+            disk = psutil.disk_usage(self._free_space_path)
+            free_mb = disk.free / (1024 * 1024)
+            if free_mb >= self.MIN_DISK_SPACE_MB:
+                checks["disk_space"] = {
+                    "ok": True,
+                    "message": f"Free disk: {free_mb:.0f} MB",
+                }
+            else:
+                checks["disk_space"] = {
+                    "ok": False,
+                    "message": f"Low disk space: {free_mb:.0f} MB (need {self.MIN_DISK_SPACE_MB} MB)",
+                }
+                all_ok = False
+        except Exception as exc:
+            checks["disk_space"] = {
+                "ok": False,
+                "message": f"Could not check disk space: {exc}",
+            }
+            all_ok = False
+
+        if all_ok:
+            return Result.ok("All prerequisites met ✅", checks=checks)
+        else:
+            failed = [n for n, c in checks.items() if not c["ok"]]
+            return Result.fail(
+                f"Prerequisites not met: {', '.join(failed)}",
+                error="Fix the above issues before starting",
+                checks=checks,
+            )
+
+    def _check_static_prerequisites(
+        self, java_bin: Optional[str], jar: Optional[Path]
+    ) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+        """Run the file-backed prerequisite checks (Java, JAR, EULA, compat)."""
         checks: Dict[str, Dict[str, Any]] = {}
         all_ok = True
 
         # 1. Java
-        java_bin = self.java_manager.get_java_binary()
         if java_bin and Path(java_bin).exists():
             checks["java"] = {"ok": True, "message": f"Java found: {java_bin}"}
         else:
@@ -429,7 +834,6 @@ class ServerManager:
             all_ok = False
 
         # 2. Server JAR
-        jar = self.get_server_jar()
         if jar and jar.exists():
             size_mb = jar.stat().st_size / (1024 * 1024)
             checks["server_jar"] = {
@@ -453,31 +857,6 @@ class ServerManager:
             }
             all_ok = False
 
-        # 4. Disk space
-        try:
-            if self._system == "Windows":
-                disk = psutil.disk_usage(str(self.server_dir.resolve().drive + "\\"))
-            else:
-                disk = psutil.disk_usage(str(self.server_dir.resolve()))
-            free_mb = disk.free / (1024 * 1024)
-            if free_mb >= self.MIN_DISK_SPACE_MB:
-                checks["disk_space"] = {
-                    "ok": True,
-                    "message": f"Free disk: {free_mb:.0f} MB",
-                }
-            else:
-                checks["disk_space"] = {
-                    "ok": False,
-                    "message": f"Low disk space: {free_mb:.0f} MB (need {self.MIN_DISK_SPACE_MB} MB)",
-                }
-                all_ok = False
-        except Exception as exc:
-            checks["disk_space"] = {
-                "ok": False,
-                "message": f"Could not check disk space: {exc}",
-            }
-            all_ok = False
-
         # 5. Java compatibility (advisory, does not block start)
         compat = self.check_java_compatibility()
         checks["java_compat"] = {
@@ -485,15 +864,27 @@ class ServerManager:
             "message": compat.message,
         }
 
-        if all_ok:
-            return Result.ok("All prerequisites met ✅", checks=checks)
-        else:
-            failed = [n for n, c in checks.items() if not c["ok"]]
-            return Result.fail(
-                f"Prerequisites not met: {', '.join(failed)}",
-                error="Fix the above issues before starting",
-                checks=checks,
-            )
+        return checks, all_ok
+
+    def _prereq_fingerprint(
+        self, java_bin: Optional[str], paths: Tuple[Optional[Path], ...]
+    ) -> tuple:
+        """Key check_prerequisites' cache on the Java binary and file mtimes."""
+        return (
+            java_bin,
+            self._mtime_ns(java_bin),
+            *(self._mtime_ns(path) for path in paths),
+        )
+
+    @staticmethod
+    def _mtime_ns(path: Optional[str | Path]) -> int:
+        """Return a file's mtime in nanoseconds, or 0 if it is missing."""
+        if not path:
+            return 0
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
 
     # ================================================================
     #  SERVER JAR
@@ -573,7 +964,7 @@ class ServerManager:
         1. Verify all prerequisites
         2. Build Java command with JVM flags
         3. Start process via subprocess.Popen
-        4. Capture stdout/stderr
+        4. Start a thread reading stdout/stderr into the log buffer
         5. Return success/failure
         """
         if self.is_running():
@@ -611,16 +1002,13 @@ class ServerManager:
         srv_cfg = self.get_server_config()
 
         ram = srv_cfg.get("ram", 2048)
-        jvm_flags_str = self.get_jvm_flags()
 
         cmd = [
             java_bin,
             f"-Xmx{ram}M",
             f"-Xms{ram}M",
         ]
-
-        if jvm_flags_str.strip():
-            cmd.extend(jvm_flags_str.split())
+        cmd.extend(self.get_jvm_flag_tokens())
 
         # Use absolute path for JAR to avoid relative path issues in CWD
         cmd.extend(["-jar", str(jar.resolve()), "--nogui"])
@@ -629,24 +1017,25 @@ class ServerManager:
 
         # ── Start process ──
         try:
-            log_path = self.logs_dir / "latest.log"
-            self._log_file_handle = open(log_path, "a", encoding="utf-8")
-
-            creation_flags = 0
-            if self._system == "Windows":
-                creation_flags = subprocess.CREATE_NO_WINDOW
-
+            # latest.log belongs to the server's own logger (which rolls it
+            # over at startup); console output is read from the pipe
             self._process = subprocess.Popen(
                 cmd,
                 cwd=str(self.server_dir),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 stdin=subprocess.PIPE,
-                creationflags=creation_flags if self._system == "Windows" else 0,
-                bufsize=1,
+                creationflags=subprocess.CREATE_NO_WINDOW if _IS_WINDOWS else 0,
+                # Own process group so _force_kill can signal the whole tree
+                start_new_session=not _IS_WINDOWS,
             )
             self._start_time = time.time()
+            self._psutil_proc = self._open_psutil_process(self._process.pid)
             self._log_buffer.clear()
+            self._players_online.clear()
+            self._player_names.clear()
+            self._last_tps = None
+            self.bust_cache()
 
             # Start async log reader
             self._start_log_reader()
@@ -676,27 +1065,16 @@ class ServerManager:
             return Result.fail("Failed to start server", error=str(exc))
 
     def _start_log_reader(self) -> None:
-        """Start a background thread to read server stdout."""
-        import threading
+        """Start a background thread that reads server stdout into the buffer."""
+        process = self._process
 
         def _reader():
             try:
-                if self._process and self._process.stdout:
-                    for raw_line in iter(self._process.stdout.readline, b""):
-                        try:
-                            line = raw_line.decode("utf-8", errors="replace").rstrip()
-                        except Exception:
-                            line = str(raw_line)
-
-                        self._log_buffer.append(line)
-
-                        # Also write to log file
-                        if self._log_file_handle and not self._log_file_handle.closed:
-                            try:
-                                self._log_file_handle.write(line + "\n")
-                                self._log_file_handle.flush()
-                            except Exception:
-                                pass
+                # read1() blocks until output arrives, then returns whatever
+                # is available; b"" means the server closed its stdout
+                while chunk := process.stdout.read1(65536):
+                    self._on_output(self._log_buffer.feed(chunk))
+                self._on_output(self._log_buffer.flush())
             except Exception as exc:
                 logger.debug("Log reader thread ended: %s", exc)
 
@@ -763,28 +1141,53 @@ class ServerManager:
         if not self._process:
             return
         try:
-            parent = psutil.Process(self._process.pid)
-            children = parent.children(recursive=True)
-            for child in children:
-                child.kill()
-            parent.kill()
-            psutil.wait_procs([parent] + children, timeout=5)
+            if _IS_WINDOWS:
+                proc = subprocess.run(
+                    ["taskkill", "/T", "/F", "/PID", str(self._process.pid)],
+                    capture_output=True,
+                    text=True,
+                    creationflags=subprocess.CREATE_NO_WINDOW,
+                )
+                if proc.returncode != 0:
+                    logger.error(
+                        "taskkill failed (exit %d): %s",
+                        proc.returncode,
+                        (proc.stderr or proc.stdout).strip(),
+                    )
+            else:
+                # The server runs in its own session (see start_server),
+                # so one signal reaches every child.
+                os.killpg(os.getpgid(self._process.pid), signal.SIGKILL)
+            # Single blocking waitpid, no polling
+            self._process.wait(timeout=self.KILL_TIMEOUT)
             logger.info("Process tree killed")
-        except (psutil.NoSuchProcess, psutil.AccessDenied, ProcessLookupError):
+        except subprocess.TimeoutExpired:
+            logger.error(
+                "Process %s still running %ds after force kill; giving up",
+                self._process.pid,
+                self.KILL_TIMEOUT,
+            )
+        except (ProcessLookupError, PermissionError):
             pass
         except Exception as exc:
             logger.error("Force kill error: %s", exc)
 
+    @staticmethod
+    def _open_psutil_process(pid: int) -> Optional[psutil.Process]:
+        """Return a psutil handle for *pid* with its CPU counter primed."""
+        try:
+            proc = psutil.Process(pid)
+            proc.cpu_percent(interval=None)  # first call always reads 0.0
+            return proc
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
     def _cleanup_process(self) -> None:
         """Reset internal process state."""
-        if self._log_file_handle and not self._log_file_handle.closed:
-            try:
-                self._log_file_handle.close()
-            except Exception:
-                pass
         self._process = None
+        self._psutil_proc = None
         self._start_time = None
-        self._log_file_handle = None
+        self.bust_cache()
 
     def restart_server(self) -> Result:
         """
@@ -854,12 +1257,19 @@ class ServerManager:
     #  STATUS MONITORING
     # ================================================================
 
+    def bust_cache(self) -> None:
+        """Drop cached status/resource results so the next poll is fresh."""
+        self._ttl_cache.clear()
+
+    @_ttl_cached(STATUS_CACHE_TTL)
     def get_server_status(self) -> ServerStatus:
         """
         Get comprehensive server status.
 
         Populates: running, PID, uptime, CPU, RAM, players, TPS, config info.
-        Player count & TPS are parsed from recent log lines.
+        Player count & TPS are tracked from server output as it arrives.
+        Results are reused for STATUS_CACHE_TTL seconds, since the app
+        bar, dashboard and web UI all poll it.
         """
         status = ServerStatus()
         srv_cfg = self.get_server_config()
@@ -878,53 +1288,83 @@ class ServerManager:
             status.pid = self._process.pid
             status.uptime_seconds = self._get_uptime()
 
-            # System resource usage via psutil
-            try:
-                proc = psutil.Process(self._process.pid)
-                status.cpu_percent = proc.cpu_percent(interval=0.5)
-                mem = proc.memory_info()
-                status.ram_used_mb = mem.rss / (1024 * 1024)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-            # Parse logs for player info and TPS
+            # System resource usage via the handle kept since start, so
+            # cpu_percent() measures the time since the previous poll
+            proc = self._psutil_proc
+            if proc is not None:
+                try:
+                    status.cpu_percent = proc.cpu_percent(interval=None)
+                    mem = proc.memory_info()
+                    status.ram_used_mb = mem.rss / (1024 * 1024)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+
+            # Player info and TPS from live log state
             self._parse_status_from_logs(status)
 
         return status
 
     def _parse_status_from_logs(self, status: ServerStatus) -> None:
-        """Parse recent log lines for player count, TPS, and player names."""
-        recent = list(self._log_buffer)[-200:]
+        """Fill in player count, player names and TPS from live log state."""
+        # Already sorted; list() copies it in one step, so a concurrent
+        # update from the reader thread can't tear the snapshot.
+        names = list(self._player_names)
+        status.players_online = len(names)
+        status.player_names = names
+        if self._last_tps is not None:
+            status.tps = self._last_tps
+
+    def _on_output(self, block: bytes) -> None:
+        """Handle a block of newly buffered output (reader thread)."""
+        if not block:
+            return
+        self._ingest_output(block)
+        # Copy: subscribers come and go on the event loop thread
+        subscribers = tuple(self._log_subscribers)
+        if not subscribers:
+            return
+        # The block's lines are the newest records in the buffer: read
+        # them back with the levels assigned on capture, decoding once
+        # for every subscriber
+        entries = [
+            (line, LOG_LEVEL_TAGS[level])
+            for line, level in self._log_buffer.tail_entries(block.count(b"\n"))
+        ]
+        for push in subscribers:
+            push(entries)
+
+    def _ingest_output(self, block: bytes) -> None:
+        """
+        Update player and TPS state from newly buffered output.
 
-        # ── Player join/leave tracking ──
+        Join/leave lines are edge-triggered, so tracking them as they
+        arrive gives the same answer as rescanning the log, at no cost
+        per status poll.
+
+        Args:
+            block: Complete lines just appended to the log buffer
+        """
         # [HH:MM:SS INFO]: PlayerName joined the game
         # [HH:MM:SS INFO]: PlayerName left the game
-        players_online: set = set()
-        join_pat = re.compile(r"(\w+) joined the game")
-        leave_pat = re.compile(r"(\w+) left the game")
-
-        for line in recent:
-            m = join_pat.search(line)
-            if m:
-                players_online.add(m.group(1))
-            m = leave_pat.search(line)
-            if m:
-                players_online.discard(m.group(1))
-
-        status.players_online = len(players_online)
-        status.player_names = sorted(players_online)
-
-        # ── TPS ──
         # Paper/Spigot: TPS from last 1m, 5m, 15m: 20.0, 20.0, 20.0
-        tps_pat = re.compile(r"TPS from last.*?:\s*([\d.]+)")
-        for line in reversed(recent):
-            m = tps_pat.search(line)
-            if m:
+        for m in _STATUS_RE.finditer(block):
+            kind = m.lastgroup
+            # Interned so every mention of a player shares one string
+            if kind == "join":
+                name = sys.intern(m.group("join").decode())
+                if name not in self._players_online:
+                    self._players_online.add(name)
+                    bisect.insort(self._player_names, name)
+            elif kind == "leave":
+                name = sys.intern(m.group("leave").decode())
+                if name in self._players_online:
+                    self._players_online.remove(name)
+                    del self._player_names[bisect.bisect_left(self._player_names, name)]
+            else:
                 try:
-                    status.tps = float(m.group(1))
+                    self._last_tps = float(m.group("tps"))
                 except ValueError:
                     pass
-                break
 
     # ================================================================
     #  LOGGING
@@ -937,21 +1377,72 @@ class ServerManager:
         Uses in-memory buffer first, falls back to file.
         """
         if self._log_buffer:
-            buf_lines = list(self._log_buffer)
-            return buf_lines[-lines:]
+            return self._log_buffer.tail(lines)
 
         # Fallback: read from file
         return self._read_log_file(lines)
 
+    async def log_stream(
+        self, backlog: int = 0
+    ) -> AsyncIterator[List[Tuple[str, str]]]:
+        """
+        Yield server output as it is captured, one list per block.
+
+        Entries are ``(line, level_tag)`` pairs, as from
+        get_recent_log_entries. The reader thread pushes each block
+        straight to the subscriber's queue, so consumers wait instead of
+        polling.
+
+        Args:
+            backlog: Number of recent lines to yield first. They are read
+                     after subscribing, so nothing is missed in between
+                     (a line may at worst appear twice).
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[List[Tuple[str, str]]] = asyncio.Queue()
+
+        def _push(entries: List[Tuple[str, str]]) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, entries)
+            except RuntimeError:
+                pass  # consumer's loop already closed
+
+        self._log_subscribers.append(_push)
+        try:
+            if backlog:
+                recent = self.get_recent_log_entries(backlog)
+                if recent:
+                    yield recent
+            while True:
+                yield await queue.get()
+        finally:
+            self._log_subscribers.remove(_push)
+
+    def get_recent_log_entries(self, lines: int = 100) -> List[Tuple[str, str]]:
+        """
+        Return the last N log lines paired with their level tag.
+
+        Tags come from LOG_LEVEL_TAGS ("plain", "info", "warning", "error")
+        and are assigned once when a line is captured.
+        """
+        if self._log_buffer:
+            return [
+                (line, LOG_LEVEL_TAGS[level])
+                for line, level in self._log_buffer.tail_entries(lines)
+            ]
+
+        return [
+            (line, LOG_LEVEL_TAGS[classify_log_line(line.encode("utf-8"))])
+            for line in self._read_log_file(lines)
+        ]
+
     def _read_log_file(self, lines: int = 100) -> List[str]:
         """Read last N lines from the log file on disk."""
         log_path = self.logs_dir / "latest.log"
         if not log_path.exists():
             return []
         try:
-            content = log_path.read_text(encoding="utf-8", errors="replace")
-            all_lines = content.splitlines()
-            return all_lines[-lines:]
+            return tail_file(log_path, lines)
         except OSError:
             return []
 
@@ -968,10 +1459,9 @@ class ServerManager:
             timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
             backup_name = f"latest_{timestamp}.log"
             backup_path = self.logs_dir / backup_name
-            shutil.copy2(log_path, backup_path)
-
-            # Clear the file
-            log_path.write_text("", encoding="utf-8")
+            # Move it aside without copying a byte and start a fresh one
+            os.replace(log_path, backup_path)
+            log_path.touch()
             self._log_buffer.clear()
 
             logger.info("Logs cleared (backup: %s)", backup_name)
@@ -994,25 +1484,26 @@ class ServerManager:
             output = Path(output_path)
             output.parent.mkdir(parents=True, exist_ok=True)
 
-            # Combine in-memory buffer and on-disk log
-            all_lines: List[str] = []
+            # The server's logger writes latest.log itself; stream it
+            # across in blocks.
             log_path = self.logs_dir / "latest.log"
-
-            if log_path.exists():
-                all_lines = log_path.read_text(
-                    encoding="utf-8", errors="replace"
-                ).splitlines()
-
-            # Append any buffer lines not yet on disk
-            if self._log_buffer:
-                all_lines.extend(list(self._log_buffer))
-
-            output.write_text("\n".join(all_lines), encoding="utf-8")
-            logger.info("Logs exported to %s (%d lines)", output, len(all_lines))
+            line_count = 0
+            last = b"\n"
+            with open(output, "wb") as dst:
+                if log_path.exists():
+                    with open(log_path, "rb") as src:
+                        while chunk := src.read(1024 * 1024):
+                            dst.write(chunk)
+                            line_count += chunk.count(b"\n")
+                            last = chunk[-1:]
+            if last != b"\n":
+                line_count += 1  # unterminated final line
+
+            logger.info("Logs exported to %s (%d lines)", output, line_count)
             return Result.ok(
-                f"Exported {len(all_lines)} lines to {output}",
+                f"Exported {line_count} lines to {output}",
                 path=str(output),
-                line_count=len(all_lines),
+                line_count=line_count,
             )
         except OSError as exc:
             logger.error("Log export failed: %s", exc)
@@ -1086,67 +1577,72 @@ class ServerManager:
     #  JVM FLAGS
     # ================================================================
 
-    # Pre-defined JVM flag profiles
-    _JVM_PROFILES: Dict[str, str] = {
-        "default": "",
+    # Pre-defined JVM flag profiles, stored pre-tokenized for Popen
+    _JVM_PROFILES: Dict[str, Tuple[str, ...]] = {
+        "default": (),
         "aikar": (
-            "-XX:+UseG1GC "
-            "-XX:+ParallelRefProcEnabled "
-            "-XX:MaxGCPauseMillis=200 "
-            "-XX:+UnlockExperimentalVMOptions "
-            "-XX:+DisableExplicitGC "
-            "-XX:+AlwaysPreTouch "
-            "-XX:G1NewSizePercent=30 "
-            "-XX:G1MaxNewSizePercent=40 "
-            "-XX:G1HeapRegionSize=8M "
-            "-XX:G1ReservePercent=20 "
-            "-XX:G1HeapWastePercent=5 "
-            "-XX:G1MixedGCCountTarget=4 "
-            "-XX:InitiatingHeapOccupancyPercent=15 "
-            "-XX:G1MixedGCLiveThresholdPercent=90 "
-            "-XX:G1RSetUpdatingPauseTimePercent=5 "
-            "-XX:SurvivorRatio=32 "
-            "-XX:+PerfDisableSharedMem "
-            "-XX:MaxTenuringThreshold=1 "
-            "-Dusing.aikars.flags=https://mcflags.emc.gs "
-            "-Daikars.new.flags=true"
+            "-XX:+UseG1GC",
+            "-XX:+ParallelRefProcEnabled",
+            "-XX:MaxGCPauseMillis=200",
+            "-XX:+UnlockExperimentalVMOptions",
+            "-XX:+DisableExplicitGC",
+            "-XX:+AlwaysPreTouch",
+            "-XX:G1NewSizePercent=30",
+            "-XX:G1MaxNewSizePercent=40",
+            "-XX:G1HeapRegionSize=8M",
+            "-XX:G1ReservePercent=20",
+            "-XX:G1HeapWastePercent=5",
+            "-XX:G1MixedGCCountTarget=4",
+            "-XX:InitiatingHeapOccupancyPercent=15",
+            "-XX:G1MixedGCLiveThresholdPercent=90",
+            "-XX:G1RSetUpdatingPauseTimePercent=5",
+            "-XX:SurvivorRatio=32",
+            "-XX:+PerfDisableSharedMem",
+            "-XX:MaxTenuringThreshold=1",
+            "-Dusing.aikars.flags=https://mcflags.emc.gs",
+            "-Daikars.new.flags=true",
         ),
         "graalvm": (
-            "-XX:+UseG1GC "
-            "-XX:+UnlockExperimentalVMOptions "
-            "-XX:+UnlockDiagnosticVMOptions "
-            "-XX:+AlwaysActAsServerClassMachine "
-            "-XX:+AlwaysPreTouch "
-            "-XX:+DisableExplicitGC "
-            "-XX:+UseNUMA "
-            "-XX:AllocatePrefetchStyle=3 "
-            "-XX:NmethodSweepActivity=1 "
-            "-XX:ReservedCodeCacheSize=400M "
-            "-XX:NonNMethodCodeHeapSize=12M "
-            "-XX:ProfiledCodeHeapSize=194M "
-            "-XX:NonProfiledCodeHeapSize=194M "
-            "-XX:-DontCompileHugeMethods "
-            "-XX:+PerfDisableSharedMem "
-            "-XX:+UseFastUnorderedTimeStamps "
-            "-XX:+UseCriticalJavaThreadPriority"
+            "-XX:+UseG1GC",
+            "-XX:+UnlockExperimentalVMOptions",
+            "-XX:+UnlockDiagnosticVMOptions",
+            "-XX:+AlwaysActAsServerClassMachine",
+            "-XX:+AlwaysPreTouch",
+            "-XX:+DisableExplicitGC",
+            "-XX:+UseNUMA",
+            "-XX:AllocatePrefetchStyle=3",
+            "-XX:NmethodSweepActivity=1",
+            "-XX:ReservedCodeCacheSize=400M",
+            "-XX:NonNMethodCodeHeapSize=12M",
+            "-XX:ProfiledCodeHeapSize=194M",
+            "-XX:NonProfiledCodeHeapSize=194M",
+            "-XX:-DontCompileHugeMethods",
+            "-XX:+PerfDisableSharedMem",
+            "-XX:+UseFastUnorderedTimeStamps",
+            "-XX:+UseCriticalJavaThreadPriority",
         ),
         "zgc": (
-            "-XX:+UseZGC "
-            "-XX:+UnlockExperimentalVMOptions "
-            "-XX:+AlwaysPreTouch "
-            "-XX:+DisableExplicitGC "
-            "-XX:-ZUncommit "
-            "-XX:+PerfDisableSharedMem"
+            "-XX:+UseZGC",
+            "-XX:+UnlockExperimentalVMOptions",
+            "-XX:+AlwaysPreTouch",
+            "-XX:+DisableExplicitGC",
+            "-XX:-ZUncommit",
+            "-XX:+PerfDisableSharedMem",
         ),
         "low_memory": (
-            "-XX:+UseSerialGC "
-            "-XX:-UseCompressedOops "
-            "-XX:+UnlockExperimentalVMOptions "
-            "-XX:+DisableExplicitGC "
-            "-XX:+AlwaysPreTouch"
+            "-XX:+UseSerialGC",
+            "-XX:-UseCompressedOops",
+            "-XX:+UnlockExperimentalVMOptions",
+            "-XX:+DisableExplicitGC",
+            "-XX:+AlwaysPreTouch",
         ),
     }
 
+    # The same profiles as display strings, joined once at class creation
+    _JVM_PROFILE_STRINGS: Dict[str, str] = {
+        name: " ".join(tokens) for name, tokens in _JVM_PROFILES.items()
+    }
+
     def get_jvm_flags(self) -> str:
         """
         Return the currently configured JVM flags string.
@@ -1160,7 +1656,18 @@ class ServerManager:
             return custom
 
         # Use profile
-        return self._JVM_PROFILES.get(profile_name, "")
+        return self._JVM_PROFILE_STRINGS.get(profile_name, "")
+
+    def get_jvm_flag_tokens(self) -> Tuple[str, ...]:
+        """
+        Return the currently configured JVM flags as argv tokens.
+        """
+        custom = self.config.get("jvm_flags", {}).get("custom", "")
+        if custom:
+            return split_jvm_flags(custom)
+
+        profile_name = self.get_server_config().get("jvm_profile", "default")
+        return self._JVM_PROFILES.get(profile_name, ())
 
     def set_jvm_flags(self, flags: str) -> Result:
         """
@@ -1171,9 +1678,8 @@ class ServerManager:
 
         Validates flags begin with '-' tokens.
         """
-        # Basic validation: each token should start with '-'
-        tokens = flags.split()
-        invalid = [t for t in tokens if t and not t.startswith("-") and "=" not in t]
+        # Basic validation: each token should start with '-' (or be key=value)
+        invalid = _BAD_JVM_TOKEN_RE.findall(flags)
         if invalid:
             return Result.fail(
                 f"Invalid JVM flag tokens: {invalid}",
@@ -1207,7 +1713,7 @@ class ServerManager:
         return Result.ok(
             f"JVM profile set to '{profile_name}'",
             profile=profile_name,
-            flags=self._JVM_PROFILES[profile_name],
+            flags=self._JVM_PROFILE_STRINGS[profile_name],
         )
 
     def get_recommended_flags(self) -> str:
@@ -1227,27 +1733,32 @@ class ServerManager:
         # Low memory environments
         if ram <= 1024:
             logger.info("Recommending low_memory flags (RAM ≤ 1 GB)")
-            return self._JVM_PROFILES["low_memory"]
+            return self._JVM_PROFILE_STRINGS["low_memory"]
 
         # Java 17+ with enough RAM → ZGC is great
         if java_ver >= 17 and ram >= 8192:
             logger.info("Recommending ZGC flags (Java %d, RAM %d MB)", java_ver, ram)
-            return self._JVM_PROFILES["zgc"]
+            return self._JVM_PROFILE_STRINGS["zgc"]
 
         # Default: Aikar's flags (battle-tested for Minecraft)
         logger.info("Recommending Aikar flags")
-        return self._JVM_PROFILES["aikar"]
+        return self._JVM_PROFILE_STRINGS["aikar"]
 
     def list_jvm_profiles(self) -> Dict[str, str]:
         """Return all available JVM flag profiles."""
-        return dict(self._JVM_PROFILES)
+        return dict(self._JVM_PROFILE_STRINGS)
 
     # ================================================================
     #  BACKUP MANAGEMENT
     # ================================================================
 
     def create_backup(self, name: Optional[str] = None) -> Result:
-        """Create a backup of the server world and configs."""
+        """
+        Create a backup of the server world and configs.
+
+        Blocks until the archive is written; see start_backup() for a
+        non-blocking variant.
+        """
         timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
         backup_name = name or f"backup_{timestamp}"
         backup_path = self.backup_dir / backup_name
@@ -1262,8 +1773,8 @@ class ServerManager:
                     error=f"Expected world at {world_dir}",
                 )
 
-            shutil.make_archive(str(backup_path), "zip", self.server_dir, world_name)
             archive = f"{backup_path}.zip"
+            self._write_world_archive(world_dir, Path(archive))
             size_mb = Path(archive).stat().st_size / (1024 * 1024)
             logger.info("Backup created: %s (%.1f MB)", archive, size_mb)
             return Result.ok(
@@ -1276,17 +1787,113 @@ class ServerManager:
             logger.error("Backup failed: %s", exc)
             return Result.fail("Backup failed", error=str(exc))
 
+    def _write_world_archive(self, world_dir: Path, archive: Path) -> None:
+        """
+        Stream *world_dir* into a zip at *archive*.
+
+        Region and NBT files are already zlib/gzip-compressed, so they are
+        stored as-is; everything else gets fast (level 1) deflate. The zip
+        is written under a temporary name and renamed into place, so a
+        half-written archive never shows up in list_backups().
+        """
+        partial = archive.with_name(archive.name + ".part")
+        root = world_dir.parent
+        try:
+            with zipfile.ZipFile(
+                partial, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+            ) as zf:
+                for dirpath, dirnames, filenames in os.walk(world_dir):
+                    dirnames.sort()
+                    rel_dir = os.path.relpath(dirpath, root)
+                    zf.write(dirpath, rel_dir)
+                    for fname in sorted(filenames):
+                        suffix = os.path.splitext(fname)[1].lower()
+                        zf.write(
+                            os.path.join(dirpath, fname),
+                            os.path.join(rel_dir, fname),
+                            compress_type=(
+                                zipfile.ZIP_STORED
+                                if suffix in self._STORED_SUFFIXES
+                                else zipfile.ZIP_DEFLATED
+                            ),
+                        )
+            os.replace(partial, archive)
+        except Exception:
+            # list_backups() never shows a .part, so nothing else would
+            # ever clean it up
+            partial.unlink(missing_ok=True)
+            raise
+
+    def start_backup(self, name: Optional[str] = None) -> str:
+        """
+        Run create_backup() on a background thread.
+
+        Args:
+            name: Optional backup name (defaults to a timestamp)
+
+        Returns:
+            Job token to pass to get_backup_status()
+        """
+        if self._backup_executor is None:
+            self._backup_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="backup"
+            )
+        self._prune_backup_jobs()
+        token = uuid.uuid4().hex
+        job = self._backup_executor.submit(self.create_backup, name)
+        job.add_done_callback(
+            lambda _: self._backup_finished.setdefault(token, time.monotonic())
+        )
+        self._backup_jobs[token] = job
+        return token
+
+    def get_backup_status(self, token: str) -> Result:
+        """
+        Poll a backup started with start_backup().
+
+        A finished job can be polled again until BACKUP_JOB_TTL has passed.
+
+        Returns:
+            Result with details["done"] False while running; once finished,
+            the create_backup() Result with details["done"] True
+        """
+        self._prune_backup_jobs()
+        job = self._backup_jobs.get(token)
+        if job is None:
+            return Result.fail(f"Unknown backup job: {token}")
+        if not job.done():
+            return Result.ok("Backup in progress…", done=False)
+
+        result = job.result()
+        result.details["done"] = True
+        return result
+
+    def _prune_backup_jobs(self) -> None:
+        """Forget backup jobs that finished more than BACKUP_JOB_TTL ago."""
+        cutoff = time.monotonic() - self.BACKUP_JOB_TTL
+        for token, finished in list(self._backup_finished.items()):
+            if finished < cutoff:
+                del self._backup_finished[token]
+                self._backup_jobs.pop(token, None)
+
     def list_backups(self) -> List[Dict[str, Any]]:
         """List all available backups."""
         backups = []
         if self.backup_dir.exists():
-            for f in sorted(self.backup_dir.glob("*.zip"), reverse=True):
+            # One directory read and one stat per entry
+            with os.scandir(self.backup_dir) as it:
+                entries = [
+                    e for e in it if e.name.endswith(".zip") and e.is_file()
+                ]
+            entries.sort(key=lambda e: e.name, reverse=True)
+            for e in entries:
+                st = e.stat()
                 backups.append({
-                    "name": f.stem,
-                    "path": str(f),
-                    "size_mb": round(f.stat().st_size / (1024 * 1024), 1),
+                    "name": e.name[:-4],
+                    "path": e.path,
+                    "size_mb": round(st.st_size / (1024 * 1024), 1),
                     "created": datetime.fromtimestamp(
-                        f.stat().st_ctime, tz=timezone.utc
+                        st.st_ctime, tz=timezone.utc
                     ).isoformat(),
                 })
         return backups
@@ -1303,29 +1910,28 @@ class ServerManager:
             "gamemode": srv_cfg.get("gamemode", "survival"),
             "difficulty": srv_cfg.get("difficulty", "normal"),
             "max-players": srv_cfg.get("max_players", 20),
-            "pvp": str(srv_cfg.get("pvp", True)).lower(),
-            "online-mode": str(srv_cfg.get("online_mode", True)).lower(),
+            "pvp": _prop_bool(srv_cfg.get("pvp", True)),
+            "online-mode": _prop_bool(srv_cfg.get("online_mode", True)),
             "level-name": srv_cfg.get("world_name", "world"),
             "motd": srv_cfg.get("motd", "A Minecraft Server"),
             "view-distance": srv_cfg.get("view_distance", 10),
             "simulation-distance": srv_cfg.get("simulation_distance", 10),
             "spawn-protection": srv_cfg.get("spawn_protection", 16),
-            "enable-command-block": str(srv_cfg.get("enable_command_block", False)).lower(),
-            "allow-flight": str(srv_cfg.get("allow_flight", False)).lower(),
-            "white-list": str(srv_cfg.get("whitelist", False)).lower(),
+            "enable-command-block": _prop_bool(srv_cfg.get("enable_command_block", False)),
+            "allow-flight": _prop_bool(srv_cfg.get("allow_flight", False)),
+            "white-list": _prop_bool(srv_cfg.get("whitelist", False)),
         }
 
         props_path = self.server_dir / "server.properties"
         try:
-            lines = [
-                "# Minecraft Server Properties",
-                "# Generated by Minecraft Server Manager",
-                f"# {datetime.now(tz=timezone.utc).isoformat()}",
-                "",
-            ]
-            for k, v in props.items():
-                lines.append(f"{k}={v}")
-            props_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            header = (
+                "# Minecraft Server Properties\n"
+                "# Generated by Minecraft Server Manager\n"
+                f"# {datetime.now(tz=timezone.utc).isoformat()}\n"
+                "\n"
+            )
+            body = "".join([f"{k}={v}\n" for k, v in props.items()])
+            props_path.write_text(header + body, encoding="utf-8")
             logger.info("Generated server.properties")
             return True
         except OSError as exc:
@@ -1336,18 +1942,16 @@ class ServerManager:
     #  SYSTEM RESOURCES
     # ================================================================
 
+    @_ttl_cached(STATUS_CACHE_TTL)
     def get_system_resources(self) -> Dict[str, Any]:
-        """Get current system resource usage."""
+        """Get current system resource usage (reused for STATUS_CACHE_TTL s)."""
         try:
             vm = psutil.virtual_memory()
-            if self._system == "Windows":
-                disk = psutil.disk_usage(str(self.server_dir.resolve().drive + "\\"))
-            else:
-                disk = psutil.disk_usage("/")
+            disk = psutil.disk_usage(self._disk_probe_path)
 
             return {
-                "cpu_percent": psutil.cpu_percent(interval=0.5),
-                "cpu_count": psutil.cpu_count(),
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "cpu_count": self._cpu_count,
                 "ram_total_mb": round(vm.total / (1024 ** 2)),
                 "ram_used_mb": round(vm.used / (1024 ** 2)),
                 "ram_available_mb": round(vm.available / (1024 ** 2)),
@@ -1357,7 +1961,7 @@ class ServerManager:
                 "disk_free_gb": round(disk.free / (1024 ** 3), 1),
                 "disk_percent": disk.percent,
                 "platform": self._system,
-                "python_version": platform.python_version(),
+                "python_version": self._python_version,
             }
         except Exception as exc:
             logger.error("Failed to get resources: %s", exc)
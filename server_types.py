@@ -25,15 +25,54 @@ Each server type provides:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import hashlib
+import json
 import logging
+import os
+import random
+import time
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
-
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import aiofiles
 import aiohttp
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:  # Windows
+    HAS_FCNTL = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,7 +80,7 @@ logger = logging.getLogger(__name__)
 #  Result Object
 # ──────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """Unified result object for server operations."""
 
@@ -90,11 +129,495 @@ class PluginPlatform(str, Enum):
     BUNGEECORD = "bungeecord"
 
 
+# ──────────────────────────────────────────────
+#  Shared HTTP Session
+# ──────────────────────────────────────────────
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
+
+# Server JARs run to tens of MB; large reads keep the write count low
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Downloads can outlast DEFAULT_TIMEOUT's total; only a stalled read fails
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=10, sock_read=60)
+
+# Minimum seconds between progress callbacks (the final one always fires)
+PROGRESS_INTERVAL = 0.1
+
+# Read size when hashing a partial download before resuming it
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _sha256_file(path: Path) -> "hashlib._Hash":
+    """Hash an existing file, returning a digest that can keep updating."""
+    # hashlib.file_digest would do this, but needs Python 3.11
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """
+    Reserve ``size`` bytes for a download up front, where supported.
+
+    One allocation gives the filesystem a chance to lay the JAR out
+    contiguously instead of extending it chunk by chunk. Unsupported
+    platforms and filesystems (tmpfs, some FUSE mounts) just skip it.
+    """
+    if not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError as exc:
+        logger.debug("posix_fallocate unavailable: %s", exc)
+
+
+# download URL → SHA-256 published by its API. URLs name a specific build,
+# so an entry never goes stale.
+_DOWNLOAD_SHA256: Dict[str, str] = {}
+
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Shared sessions from earlier event loops that are not yet closed
+_retired_sessions: List[aiohttp.ClientSession] = []
+
+
+async def _close_retired_sessions() -> None:
+    """Close sessions left behind by earlier loops."""
+    while _retired_sessions:
+        session = _retired_sessions.pop()
+        try:
+            await session.close()
+        except Exception as exc:
+            logger.debug("Could not close retired session: %s", exc)
+
+
+def _retire_shared_session(
+    session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """
+    Close a shared session that belongs to a different event loop.
+
+    A loop still running on another thread closes its own session. A
+    finished loop (e.g. after asyncio.run() returned) has nothing left to
+    wait on, so the close runs on the current loop; if that loop ends
+    before getting to it, the exit hook does it instead.
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    _retired_sessions.append(session)
+    asyncio.get_running_loop().create_task(_close_retired_sessions())
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Return the module's pooled session for the running event loop.
+
+    Created on first use with a keep-alive connection pool, so repeat
+    requests to the same API host skip the TCP/TLS handshake. Public
+    functions here fall back to it when no session is passed in.
+
+    A session is tied to one loop, so a new loop gets a new session and
+    the old one is closed. Code that runs each call in its own short-lived
+    loop (asyncio.run() per request) gains nothing from the pool: pass a
+    session explicitly, or await close_shared_session() before the loop
+    ends.
+
+    Must be called from inside a coroutine.
+    """
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_session is None
+        or _shared_session.closed
+        or _shared_session_loop is not loop
+    ):
+        if _shared_session is not None and not _shared_session.closed:
+            _retire_shared_session(_shared_session, _shared_session_loop)
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+            timeout=DEFAULT_TIMEOUT,
+            raise_for_status=False,
+        )
+        _shared_session_loop = loop
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared session, if one is open."""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
+
+# Transient failures (5xx, dropped connections, timeouts) are retried with
+# jittered exponential backoff: 0.2 s, 0.4 s, … plus up to 0.1 s.
+HTTP_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2
+
+
+async def _get_with_retry(
+    session: aiohttp.ClientSession, url: str, **kwargs: Any
+) -> aiohttp.ClientResponse:
+    """
+    GET ``url``, retrying transient failures.
+
+    Every request in this module is an idempotent GET, so a retry is
+    always safe. The caller owns the returned response (use ``async with``).
+
+    Args:
+        session: aiohttp session
+        url:     URL to fetch
+        **kwargs: Passed through to ``session.get``
+
+    Returns:
+        The final response, which may still carry a 5xx status
+
+    Raises:
+        aiohttp.ClientConnectionError / asyncio.TimeoutError from the last attempt
+    """
+    for attempt in range(HTTP_ATTEMPTS - 1):
+        try:
+            resp = await session.get(url, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            pass
+        else:
+            if resp.status < 500:
+                return resp
+            resp.release()
+        await asyncio.sleep(
+            RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, 0.1)
+        )
+
+    try:
+        resp = await session.get(url, **kwargs)
+    except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+        logger.warning(
+            "GET %s failed after %d attempts: %s", url, HTTP_ATTEMPTS, exc
+        )
+        raise
+    if resp.status >= 500:
+        logger.warning(
+            "GET %s failed after %d attempts: HTTP %d",
+            url, HTTP_ATTEMPTS, resp.status,
+        )
+    return resp
+
+
+@atexit.register
+def _close_shared_session_at_exit() -> None:
+    """Best-effort close at interpreter exit."""
+    if _retired_sessions:
+        asyncio.run(_close_retired_sessions())
+    loop = _shared_session_loop
+    if _shared_session is None or _shared_session.closed or loop is None:
+        return
+    if loop.is_closed():
+        # As with retired sessions: nothing left to wait on
+        asyncio.run(close_shared_session())
+    elif not loop.is_running():
+        loop.run_until_complete(close_shared_session())
+
+
+# ──────────────────────────────────────────────
+#  Version List Cache
+# ──────────────────────────────────────────────
+
+# Version lists change on the order of weeks. Each entry lives for a random
+# span inside this window so entries fetched together don't all expire (and
+# refetch) together.
+VERSIONS_CACHE_TTL: Tuple[float, float] = (600.0, 900.0)
+
+# software → (monotonic expiry time, versions newest first, same as a set,
+# conditional request headers). Expired entries stay so their ETag /
+# Last-Modified can turn the refetch into a bodiless 304.
+_VERSIONS_CACHE: Dict[
+    "ServerSoftware",
+    Tuple[float, List[str], FrozenSet[str], Dict[str, str]],
+] = {}
+
+# On-disk caches live here; the version lists persist across runs so a
+# fresh process (e.g. a one-off CLI call) can skip the network.
+CACHE_DIR = Path.home() / ".cache" / "mcsm"
+VERSIONS_CACHE_FILE = CACHE_DIR / "versions.json"
+
+
+def _conditional_headers(response_headers: Mapping[str, str]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since from a response's validators."""
+    headers: Dict[str, str] = {}
+    if "ETag" in response_headers:
+        headers["If-None-Match"] = response_headers["ETag"]
+    if "Last-Modified" in response_headers:
+        headers["If-Modified-Since"] = response_headers["Last-Modified"]
+    return headers
+
+
+# Set once VERSIONS_CACHE_FILE has been read, on the first version lookup
+# (not at import, so importing never touches the user's home directory)
+_versions_cache_loaded = False
+
+
+def _load_versions_cache() -> None:
+    """
+    Seed _VERSIONS_CACHE from VERSIONS_CACHE_FILE.
+
+    Entries are stored with their wall-clock fetch time and get whatever
+    is left of their TTL. Stale entries are still loaded: their validators
+    let the first refetch come back as a 304.
+    """
+    global _versions_cache_loaded
+    _versions_cache_loaded = True
+    try:
+        stored = json.loads(VERSIONS_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    now_wall, now_mono = time.time(), time.monotonic()
+    for key, entry in stored.items():
+        try:
+            software = ServerSoftware(key)
+            versions = list(entry["versions"])
+            age = now_wall - float(entry["fetched_at"])
+            validators = dict(entry.get("validators", {}))
+        except (ValueError, KeyError, TypeError):
+            continue
+        expires = now_mono + random.uniform(*VERSIONS_CACHE_TTL) - age
+        _VERSIONS_CACHE[software] = (
+            expires, versions, frozenset(versions), validators,
+        )
+
+
+def _persist_versions_entry(
+    software: ServerSoftware, versions: List[str], validators: Dict[str, str]
+) -> None:
+    """
+    Merge one software's list into VERSIONS_CACHE_FILE.
+
+    Read-modify-write happens under an exclusive lock (where fcntl is
+    available) and lands via os.replace, so concurrent processes neither
+    lose each other's entries nor see a half-written file.
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_DIR / "versions.lock", "w") as lock:
+            if HAS_FCNTL:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                stored = json.loads(VERSIONS_CACHE_FILE.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                stored = {}
+            stored[software.value] = {
+                "fetched_at": time.time(),
+                "versions": versions,
+                "validators": validators,
+            }
+            tmp = VERSIONS_CACHE_FILE.with_suffix(".tmp")
+            tmp.write_text(json.dumps(stored), encoding="utf-8")
+            os.replace(tmp, VERSIONS_CACHE_FILE)
+    except OSError as exc:
+        logger.debug("Could not persist version cache: %s", exc)
+
+
+# software → fetch in progress; concurrent callers all await this one task
+_VERSIONS_INFLIGHT: Dict["ServerSoftware", "asyncio.Task"] = {}
+
+# (project, MC version) → (monotonic expiry, latest build's download URL)
+PAPERMC_BUILD_TTL = 300.0
+_PAPERMC_BUILD_CACHE: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+# Fabric/Quilt meta base URL → (monotonic expiry, loader, installer version)
+_LOADER_CACHE: Dict[str, Tuple[float, str, str]] = {}
+
+
+async def _read_json(resp: aiohttp.ClientResponse) -> Any:
+    """Decode a response body, with orjson when it is installed."""
+    body = await resp.read()
+    if HAS_ORJSON:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+async def _fetch_json(session: aiohttp.ClientSession, url: str) -> Any:
+    """GET ``url`` and decode its JSON body; None on a non-200 response."""
+    async with await _get_with_retry(session, url) as resp:
+        if resp.status != 200:
+            return None
+        return await _read_json(resp)
+
+
+async def _latest_loader_and_installer(
+    meta_base: str, session: aiohttp.ClientSession
+) -> Optional[Tuple[str, str]]:
+    """
+    Return the newest (loader, installer) versions from a Fabric-style meta API.
+
+    The two listings are independent, so both requests run concurrently.
+    The pair is cached for VERSIONS_CACHE_TTL like the version lists.
+
+    Args:
+        meta_base: Meta API versions root, e.g. ``…/v2/versions``
+        session:   aiohttp session
+
+    Returns:
+        (loader_version, installer_version), or None if either lookup failed
+    """
+    cached = _LOADER_CACHE.get(meta_base)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1], cached[2]
+
+    loaders, installers = await asyncio.gather(
+        _fetch_json(session, f"{meta_base}/loader"),
+        _fetch_json(session, f"{meta_base}/installer"),
+        return_exceptions=True,
+    )
+    for result in (loaders, installers):
+        if isinstance(result, BaseException):
+            raise result
+    if not loaders or not installers:
+        return None
+
+    loader_version = loaders[0]["version"]
+    installer_version = installers[0]["version"]
+    expires = time.monotonic() + random.uniform(*VERSIONS_CACHE_TTL)
+    _LOADER_CACHE[meta_base] = (expires, loader_version, installer_version)
+    return loader_version, installer_version
+
+
+# ──────────────────────────────────────────────
+#  Mojang Manifest Cache
+# ──────────────────────────────────────────────
+
+MOJANG_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+
+# Resolved server JAR URLs, one small JSON file per version id
+MOJANG_CACHE_DIR = CACHE_DIR / "mojang"
+
+# The top-level manifest gains entries with each release, so it is only
+# held in memory for about an hour (jittered like VERSIONS_CACHE_TTL).
+MOJANG_MANIFEST_TTL: Tuple[float, float] = (3300.0, 3900.0)
+
+_mojang_manifest_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def _mojang_cache_file(version: str) -> Path:
+    """Return the on-disk cache file for a vanilla version id."""
+    digest = hashlib.sha256(version.encode()).hexdigest()[:16]
+    return MOJANG_CACHE_DIR / f"{digest}.json"
+
+
+def _read_mojang_cache(cache_file: Path) -> Optional[str]:
+    """Return the cached server JAR URL, or None if missing or unreadable."""
+    try:
+        return json.loads(cache_file.read_text(encoding="utf-8")).get("url")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_mojang_cache(cache_file: Path, url: str) -> None:
+    """Record a resolved server JAR URL; failures only cost a refetch."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"url": url, "fetched_at": time.time()}),
+            encoding="utf-8",
+        )
+        tmp.replace(cache_file)
+    except OSError as exc:
+        logger.debug("Could not write Mojang cache %s: %s", cache_file, exc)
+
+
+async def _mojang_manifest(
+    session: aiohttp.ClientSession,
+) -> Optional[Dict[str, Any]]:
+    """Return Mojang's version manifest, served from memory while fresh."""
+    global _mojang_manifest_cache
+    cached = _mojang_manifest_cache
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+    manifest = await _fetch_json(session, MOJANG_MANIFEST_URL)
+    if manifest is not None:
+        expires = time.monotonic() + random.uniform(*MOJANG_MANIFEST_TTL)
+        _mojang_manifest_cache = (expires, manifest)
+    return manifest
+
+
+async def _mojang_version_url(
+    version: str, session: aiohttp.ClientSession
+) -> Optional[str]:
+    """
+    Find the per-version manifest URL for ``version``.
+
+    Uses the in-memory manifest when fresh. Otherwise, with ijson
+    installed, the manifest is streamed and parsing stops at the matching
+    entry instead of decoding every version.
+    """
+    cached = _mojang_manifest_cache
+    if not HAS_IJSON or (cached and time.monotonic() < cached[0]):
+        manifest = await _mojang_manifest(session)
+        if manifest is None:
+            return None
+        for v in manifest.get("versions", []):
+            if v["id"] == version:
+                return v["url"]
+        return None
+
+    async with await _get_with_retry(session, MOJANG_MANIFEST_URL) as resp:
+        if resp.status != 200:
+            return None
+        async for v in ijson.items_async(resp.content, "versions.item"):
+            if v["id"] == version:
+                return v["url"]
+    return None
+
+
+# ──────────────────────────────────────────────
+#  Version Response Parsers
+# ──────────────────────────────────────────────
+# These run over every entry of a versions response (hundreds for Mojang),
+# so they subscript keys each API always sends instead of calling .get().
+
+def _parse_version_list(data: Dict[str, Any]) -> List[str]:
+    """PaperMC / Purpur: ``{"versions": [...]}``."""
+    return data.get("versions", [])
+
+
+def _parse_mojang_releases(data: Dict[str, Any]) -> List[str]:
+    """Mojang manifest: release ids, skipping snapshots and betas."""
+    return [v["id"] for v in data.get("versions", []) if v["type"] == "release"]
+
+
+def _parse_stable_versions(data: List[Dict[str, Any]]) -> List[str]:
+    """Fabric / Quilt meta: stable game versions only."""
+    return [v["version"] for v in data if v["stable"]]
+
+
+# ──────────────────────────────────────────────
+#  Java Requirements
+# ──────────────────────────────────────────────
+
+# (first MC 1.x release, minimum Java), newest first; anything older → Java 8
+_JAVA_THRESHOLDS: Tuple[Tuple[Tuple[int, int], int], ...] = (
+    ((20, 5), 21),
+    ((17, 0), 17),
+    ((12, 0), 11),
+)
+
+
 # ──────────────────────────────────────────────
 #  Server Type Dataclass
 # ──────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ServerType:
     """
     Represents a Minecraft server software type.
@@ -128,63 +651,160 @@ class ServerType:
     supports_mods: bool = False
     api_key_env: Optional[str] = None
     requires_auth: bool = False
+    _headers: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     # ================================================================
     #  VERSION RESOLUTION
     # ================================================================
 
     async def get_available_versions(
-        self, session: aiohttp.ClientSession
+        self, session: Optional[aiohttp.ClientSession] = None
     ) -> List[str]:
         """
         Fetch all available MC versions for this server software.
 
+        Results are cached per software for VERSIONS_CACHE_TTL; concurrent
+        callers on a cold cache share one request.
+
         Returns:
             List of version strings, sorted newest first
         """
+        versions, _ = await self._cached_versions(session)
+        return list(versions)
+
+    def invalidate_versions_cache(self) -> None:
+        """Drop the cached version list so the next lookup refetches it."""
+        _VERSIONS_CACHE.pop(self.software, None)
+
+    async def _cached_versions(
+        self, session: Optional[aiohttp.ClientSession]
+    ) -> Tuple[List[str], FrozenSet[str]]:
+        """
+        Return the (list, set) pair for this software, fetching on a miss.
+
+        A miss starts one fetch task that every concurrent caller awaits
+        (single-flight), so N simultaneous lookups cost one request.
+        """
+        if not _versions_cache_loaded:
+            _load_versions_cache()
+        cached = _VERSIONS_CACHE.get(self.software)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1], cached[2]
+
+        session = session or get_shared_session()
+        task = _VERSIONS_INFLIGHT.get(self.software)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._fetch_and_cache_versions(session))
+            _VERSIONS_INFLIGHT[self.software] = task
+            task.add_done_callback(
+                lambda _t, key=self.software: _VERSIONS_INFLIGHT.pop(key, None)
+            )
+        # Shielded: one caller giving up must not cancel everyone's fetch
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache_versions(
+        self, session: aiohttp.ClientSession
+    ) -> Tuple[List[str], FrozenSet[str]]:
+        """Fetch the version list and cache it if the fetch succeeded."""
+        stale = _VERSIONS_CACHE.get(self.software)
+        versions, validators = await self._fetch_versions(
+            session, stale[3] if stale else {}
+        )
+        if versions is None and stale:
+            # 304: the expired entry is still current
+            versions, members = stale[1], stale[2]
+        else:
+            versions = versions or []
+            members = frozenset(versions)
+        if versions:
+            expires = time.monotonic() + random.uniform(*VERSIONS_CACHE_TTL)
+            _VERSIONS_CACHE[self.software] = (expires, versions, members, validators)
+            await asyncio.to_thread(
+                _persist_versions_entry, self.software, versions, validators
+            )
+        return versions, members
+
+    async def _fetch_versions(
+        self,
+        session: aiohttp.ClientSession,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Optional[List[str]], Dict[str, str]]:
+        """
+        Fetch the version list from the upstream API.
+
+        Args:
+            session:    aiohttp session
+            validators: Conditional headers from the previous response
+
+        Returns:
+            (versions, validators for next time). versions is None when the
+            server answered 304 Not Modified, and [] on failure.
+        """
         try:
             url = self._versions_url()
             if not url:
                 logger.warning("No versions URL for %s", self.name)
-                return []
+                return [], {}
 
-            headers = self._get_headers()
-            async with session.get(
-                url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)
+            headers = {**self._get_headers(), **(validators or {})}
+            async with await _get_with_retry(
+                session, url, headers=headers,
+                timeout=aiohttp.ClientTimeout(total=15),
             ) as resp:
+                if resp.status == 304 and validators:
+                    logger.debug("Versions for %s not modified", self.name)
+                    return None, validators
                 if resp.status != 200:
                     logger.warning(
                         "Failed to fetch versions for %s: HTTP %d",
                         self.name, resp.status,
                     )
-                    return []
-                data = await resp.json()
+                    return [], {}
+                data = await _read_json(resp)
                 versions = self._parse_versions(data)
                 logger.info("Fetched %d versions for %s", len(versions), self.name)
-                return versions
+                return versions, _conditional_headers(resp.headers)
 
         except Exception as exc:
             logger.error("Error fetching versions for %s: %s", self.name, exc)
-            return []
+            return [], {}
 
     async def is_version_supported(
-        self, version: str, session: aiohttp.ClientSession
+        self, version: str, session: Optional[aiohttp.ClientSession] = None
     ) -> bool:
         """
         Check if a specific version is available for this server type.
 
         Args:
             version: Minecraft version (e.g. "1.20.4")
-            session: aiohttp session
+            session: aiohttp session (default: the shared pooled session)
 
         Returns:
             True if the version is supported
         """
-        versions = await self.get_available_versions(session)
-        return version in versions
+        _, members = await self._cached_versions(session)
+        return version in members
+
+    async def is_versions_supported(
+        self, versions: Iterable[str], session: Optional[aiohttp.ClientSession] = None
+    ) -> Dict[str, bool]:
+        """
+        Check several versions against one fetch of the version list.
+
+        Args:
+            versions: Minecraft versions to check
+            session:  aiohttp session (default: the shared pooled session)
+
+        Returns:
+            Dict of version → True if supported
+        """
+        _, members = await self._cached_versions(session)
+        return {v: v in members for v in versions}
 
     async def get_latest_version(
-        self, session: aiohttp.ClientSession
+        self, session: Optional[aiohttp.ClientSession] = None
     ) -> Optional[str]:
         """
         Get the latest available MC version for this server type.
@@ -192,7 +812,7 @@ class ServerType:
         Returns:
             Latest version string or None
         """
-        versions = await self.get_available_versions(session)
+        versions, _ = await self._cached_versions(session)
         return versions[0] if versions else None
 
     # ================================================================
@@ -202,40 +822,29 @@ class ServerType:
     async def get_download_url(
         self,
         version: str,
-        session: aiohttp.ClientSession,
+        session: Optional[aiohttp.ClientSession] = None,
     ) -> Optional[str]:
         """
         Resolve the download URL for a specific MC version.
 
         Args:
             version: Minecraft version (e.g. "1.20.4")
-            session: aiohttp session
+            session: aiohttp session (default: the shared pooled session)
 
         Returns:
-            Direct download URL or None if unavailable
+            Direct download URL or None if unavailable (including software
+            with no resolver)
         """
+        handler = self._DOWNLOAD_HANDLERS.get(self.software)
+        if handler is None:
+            logger.warning(
+                "Download URL resolution not implemented for %s", self.name
+            )
+            return None
+
+        session = session or get_shared_session()
         try:
-            if self.software == ServerSoftware.PAPER:
-                return await self._paper_download_url(version, session)
-            elif self.software == ServerSoftware.PURPUR:
-                return await self._purpur_download_url(version, session)
-            elif self.software == ServerSoftware.VANILLA:
-                return await self._vanilla_download_url(version, session)
-            elif self.software == ServerSoftware.FABRIC:
-                return await self._fabric_download_url(version, session)
-            elif self.software == ServerSoftware.QUILT:
-                return await self._quilt_download_url(version, session)
-            elif self.software == ServerSoftware.FORGE:
-                return await self._forge_download_url(version, session)
-            elif self.software == ServerSoftware.VELOCITY:
-                return await self._velocity_download_url(version, session)
-            elif self.software == ServerSoftware.BUNGEECORD:
-                return await self._bungeecord_download_url(version, session)
-            else:
-                logger.warning(
-                    "Download URL resolution not implemented for %s", self.name
-                )
-                return None
+            return await handler(self, version, session)
 
         except Exception as exc:
             logger.error(
@@ -252,21 +861,30 @@ class ServerType:
         self,
         version: str,
         dest_path: str | Path,
-        session: aiohttp.ClientSession,
+        session: Optional[aiohttp.ClientSession] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> Result:
         """
         Download server software to a file with progress tracking.
 
+        Data is written to ``<dest>.part`` and renamed into place once
+        complete. For builds with a published SHA-256 a failed download
+        keeps its ``.part`` file, and the next attempt resumes it with an
+        HTTP Range request (the checksum still covers the whole file).
+        A ``.part.size`` file records the preallocated size: a ``.part``
+        that still has it was never trimmed to the bytes written (the
+        process died mid-download) and is restarted instead of resumed.
+
         Args:
             version:           Minecraft version
             dest_path:         Destination file path
-            session:           aiohttp session
+            session:           aiohttp session (default: the shared pooled session)
             progress_callback: Optional callback(downloaded, total)
 
         Returns:
             Result with download status
         """
+        session = session or get_shared_session()
         dest = Path(dest_path)
         dest.parent.mkdir(parents=True, exist_ok=True)
 
@@ -279,28 +897,91 @@ class ServerType:
 
         logger.info("Downloading %s %s from %s", self.name, version, url)
 
+        part = dest.with_name(dest.name + ".part")
+        size_file = part.with_name(part.name + ".size")
+        # Only build-pinned URLs resume: the checksum proves the old bytes
+        # and the new ones belong to the same file.
+        expected = _DOWNLOAD_SHA256.get(url)
+        offset = 0
+        if expected:
+            try:
+                offset = part.stat().st_size
+            except FileNotFoundError:
+                pass
+            try:
+                preallocated = int(size_file.read_text())
+            except (OSError, ValueError):
+                preallocated = 0
+            if offset and preallocated and offset >= preallocated:
+                # Still at its preallocated size, so the written offset is
+                # unknown (and a Range from there would only get a 416)
+                logger.info("Discarding untrimmed %s", part.name)
+                part.unlink(missing_ok=True)
+                offset = 0
+        size_file.unlink(missing_ok=True)
+
         try:
             headers = self._get_headers()
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
+            if offset:
+                headers = {**headers, "Range": f"bytes={offset}-"}
+            async with await _get_with_retry(
+                session, url, headers=headers, timeout=DOWNLOAD_TIMEOUT
+            ) as resp:
+                if resp.status == 200:
+                    offset = 0  # Range ignored; start over
+                elif not (resp.status == 206 and offset):
+                    if resp.status == 416:
+                        part.unlink(missing_ok=True)
                     return Result.fail(
                         f"Download failed: HTTP {resp.status}",
                         error=f"Server returned {resp.status}",
                         url=url,
                     )
 
-                total_size = int(resp.headers.get("Content-Length", 0))
-                downloaded = 0
-
-                with open(dest, "wb") as fh:
-                    async for chunk in resp.content.iter_chunked(8192):
-                        fh.write(chunk)
-                        downloaded += len(chunk)
-                        if progress_callback:
-                            progress_callback(downloaded, total_size)
+                length = int(resp.headers.get("Content-Length", 0))
+                total_size = offset + length if length else 0
+                downloaded = offset
+                last_report = 0.0
+                if offset:
+                    logger.info("Resuming %s at byte %d", part.name, offset)
+                    digest = await asyncio.to_thread(_sha256_file, part)
+                else:
+                    digest = hashlib.sha256()
+
+                # r+b rather than ab: appends would land after the
+                # preallocated region instead of at the resume offset
+                async with aiofiles.open(part, "r+b" if offset else "wb") as fh:
+                    await fh.seek(offset)
+                    if total_size:
+                        if expected:
+                            size_file.write_text(str(total_size))
+                        await asyncio.to_thread(
+                            _preallocate, fh.fileno(), total_size
+                        )
+                    try:
+                        async for chunk in resp.content.iter_chunked(
+                            DOWNLOAD_CHUNK_SIZE
+                        ):
+                            await fh.write(chunk)
+                            digest.update(chunk)
+                            downloaded += len(chunk)
+                            if progress_callback:
+                                now = time.monotonic()
+                                if now - last_report >= PROGRESS_INTERVAL:
+                                    last_report = now
+                                    progress_callback(downloaded, total_size)
+                    finally:
+                        if total_size and downloaded != total_size:
+                            # Drop the preallocated tail: keeps the size
+                            # check honest and the .part resumable
+                            await fh.truncate(downloaded)
+                        size_file.unlink(missing_ok=True)
+
+                if progress_callback:
+                    progress_callback(downloaded, total_size)
 
             # Verify file
-            actual_size = dest.stat().st_size
+            actual_size = part.stat().st_size
             logger.info(
                 "Downloaded %s %s: %d bytes",
                 self.name, version, actual_size,
@@ -312,17 +993,30 @@ class ServerType:
                     total_size, actual_size,
                 )
 
+            sha256 = digest.hexdigest()
+            if expected and sha256 != expected.lower():
+                part.unlink()
+                return Result.fail(
+                    f"Checksum mismatch for {self.name} {version}",
+                    error=f"Expected SHA-256 {expected}, got {sha256}",
+                    url=url,
+                )
+
+            os.replace(part, dest)
             return Result.ok(
                 f"Downloaded {self.name} {version}",
                 path=str(dest),
                 size_bytes=actual_size,
                 url=url,
+                sha256=sha256,
+                verified=bool(expected),
+                resumed_from=offset,
             )
 
         except Exception as exc:
             logger.error("Download failed: %s", exc)
-            if dest.exists():
-                dest.unlink()
+            if not expected:
+                part.unlink(missing_ok=True)
             return Result.fail(
                 f"Download failed: {exc}",
                 error=str(exc),
@@ -334,6 +1028,7 @@ class ServerType:
     # ================================================================
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def java_version_for_mc(mc_version: str) -> int:
         """
         Return the minimum Java version required for a given MC version.
@@ -346,21 +1041,17 @@ class ServerType:
             MC < 1.12     → Java 8
         """
         try:
-            parts = mc_version.split(".")
-            major = int(parts[1]) if len(parts) >= 2 else 0
-            minor = int(parts[2]) if len(parts) >= 3 else 0
-
-            if major >= 21 or (major == 20 and minor >= 5):
-                return 21
-            elif major >= 17:
-                return 17
-            elif major >= 12:
-                return 11
-            else:
-                return 8
-        except (ValueError, IndexError):
+            rest = mc_version.partition(".")[2]
+            major, _, minor = rest.partition(".")
+            release = (int(major or 0), int(minor.partition(".")[0] or 0))
+        except ValueError:
             return 17  # Safe default
 
+        for since, java in _JAVA_THRESHOLDS:
+            if release >= since:
+                return java
+        return 8
+
     def get_java_requirement(self, mc_version: str) -> int:
         """Get minimum Java for this server + MC version."""
         return max(self.min_java, self.java_version_for_mc(mc_version))
@@ -374,11 +1065,21 @@ class ServerType:
     # ================================================================
 
     def _get_headers(self) -> Dict[str, str]:
+        """
+        Return request headers, including auth if required.
+
+        Built on first use and reused afterwards (the API key env var is
+        fixed for the process). The dict is shared: copy before changing it.
+        """
+        if self._headers is None:
+            self._headers = self._build_headers()
+        return self._headers
+
+    def _build_headers(self) -> Dict[str, str]:
         """Build headers including auth if required."""
         headers = {"User-Agent": "MinecraftServerManager/1.0"}
 
         if self.requires_auth and self.api_key_env:
-            import os
             api_key = os.environ.get(self.api_key_env, "")
             if api_key:
                 if self.software == ServerSoftware.FORGE:
@@ -393,7 +1094,7 @@ class ServerType:
         urls = {
             ServerSoftware.PAPER: f"{self.api_base}/v2/projects/paper",
             ServerSoftware.PURPUR: f"{self.api_base}/v2",
-            ServerSoftware.VANILLA: "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json",
+            ServerSoftware.VANILLA: MOJANG_MANIFEST_URL,
             ServerSoftware.FABRIC: f"{self.api_base}/v2/versions/game",
             ServerSoftware.QUILT: "https://meta.quiltmc.org/v3/versions/game",
             ServerSoftware.VELOCITY: f"{self.api_base}/v2/projects/velocity",
@@ -401,23 +1102,20 @@ class ServerType:
         }
         return urls.get(self.software)
 
+    # software → parser for its versions endpoint response
+    _VERSION_PARSERS: ClassVar[Dict[ServerSoftware, Callable[[Any], List[str]]]] = {
+        ServerSoftware.PAPER: _parse_version_list,
+        ServerSoftware.VELOCITY: _parse_version_list,
+        ServerSoftware.PURPUR: _parse_version_list,
+        ServerSoftware.VANILLA: _parse_mojang_releases,
+        ServerSoftware.FABRIC: _parse_stable_versions,
+        ServerSoftware.QUILT: _parse_stable_versions,
+    }
+
     def _parse_versions(self, data: dict | list) -> List[str]:
         """Extract version strings from API-specific response shapes."""
-        if self.software in (ServerSoftware.PAPER, ServerSoftware.VELOCITY):
-            return data.get("versions", [])
-        elif self.software == ServerSoftware.PURPUR:
-            return data.get("versions", [])
-        elif self.software == ServerSoftware.VANILLA:
-            return [
-                v["id"]
-                for v in data.get("versions", [])
-                if v.get("type") == "release"
-            ]
-        elif self.software == ServerSoftware.FABRIC:
-            return [v["version"] for v in data if v.get("stable", False)]
-        elif self.software == ServerSoftware.QUILT:
-            return [v["version"] for v in data if v.get("stable", False)]
-        return []
+        parser = self._VERSION_PARSERS.get(self.software)
+        return parser(data) if parser else []
 
     # ================================================================
     #  PRIVATE: PER-SOFTWARE DOWNLOAD URL RESOLVERS
@@ -427,21 +1125,41 @@ class ServerType:
         self, version: str, session: aiohttp.ClientSession
     ) -> Optional[str]:
         """Resolve Paper download: project → version → latest build → JAR."""
-        builds_url = f"{self.api_base}/v2/projects/paper/versions/{version}/builds"
-        async with session.get(builds_url) as resp:
-            if resp.status != 200:
-                return None
-            data = await resp.json()
-            builds = data.get("builds", [])
-            if not builds:
-                return None
-            latest = builds[-1]
-            build_num = latest["build"]
-            jar_name = latest["downloads"]["application"]["name"]
-            return (
-                f"{self.api_base}/v2/projects/paper/versions/{version}"
-                f"/builds/{build_num}/downloads/{jar_name}"
-            )
+        return await self._papermc_download_url("paper", version, session)
+
+    async def _papermc_download_url(
+        self, project: str, version: str, session: aiohttp.ClientSession
+    ) -> Optional[str]:
+        """
+        Resolve the latest build JAR of a PaperMC-hosted project.
+
+        The build's published SHA-256 is remembered so download_server
+        can verify the file. The resolved URL is reused for
+        PAPERMC_BUILD_TTL, since new builds land at most a few times a day.
+        """
+        key = (project, version)
+        cached = _PAPERMC_BUILD_CACHE.get(key)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        builds_url = f"{self.api_base}/v2/projects/{project}/versions/{version}/builds"
+        data = await _fetch_json(session, builds_url)
+        if data is None:
+            return None
+        builds = data.get("builds", [])
+        if not builds:
+            return None
+        latest = builds[-1]
+        build_num = latest["build"]
+        application = latest["downloads"]["application"]
+        url = (
+            f"{self.api_base}/v2/projects/{project}/versions/{version}"
+            f"/builds/{build_num}/downloads/{application['name']}"
+        )
+        if application.get("sha256"):
+            _DOWNLOAD_SHA256[url] = application["sha256"]
+        _PAPERMC_BUILD_CACHE[key] = (time.monotonic() + PAPERMC_BUILD_TTL, url)
+        return url
 
     async def _purpur_download_url(
         self, version: str, session: aiohttp.ClientSession
@@ -452,50 +1170,40 @@ class ServerType:
     async def _vanilla_download_url(
         self, version: str, session: aiohttp.ClientSession
     ) -> Optional[str]:
-        """Resolve Vanilla server JAR from Mojang's version manifest."""
-        manifest_url = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
-        async with session.get(manifest_url) as resp:
-            if resp.status != 200:
-                return None
-            data = await resp.json()
-            for v in data.get("versions", []):
-                if v["id"] == version:
-                    version_url = v["url"]
-                    async with session.get(version_url) as vresp:
-                        if vresp.status != 200:
-                            return None
-                        vdata = await vresp.json()
-                        return (
-                            vdata.get("downloads", {})
-                            .get("server", {})
-                            .get("url")
-                        )
-        return None
+        """
+        Resolve Vanilla server JAR from Mojang's version manifest.
+
+        A release's server JAR never changes, so the resolved URL is kept
+        on disk and later lookups for that version make no requests.
+        """
+        cache_file = _mojang_cache_file(version)
+        url = _read_mojang_cache(cache_file)
+        if url:
+            return url
+
+        version_url = await _mojang_version_url(version, session)
+        if version_url is None:
+            return None
+        vdata = await _fetch_json(session, version_url)
+        if vdata is None:
+            return None
+        try:
+            url = vdata["downloads"]["server"]["url"]
+        except KeyError:
+            # Very old releases shipped no standalone server JAR
+            return None
+        _write_mojang_cache(cache_file, url)
+        return url
 
     async def _fabric_download_url(
         self, version: str, session: aiohttp.ClientSession
     ) -> Optional[str]:
         """Resolve Fabric server installer URL."""
-        # Get latest loader version
-        loader_url = f"{self.api_base}/v2/versions/loader"
-        async with session.get(loader_url) as resp:
-            if resp.status != 200:
-                return None
-            loaders = await resp.json()
-            if not loaders:
-                return None
-            loader_version = loaders[0]["version"]
-
-        # Get latest installer version
-        installer_url = f"{self.api_base}/v2/versions/installer"
-        async with session.get(installer_url) as resp:
-            if resp.status != 200:
-                return None
-            installers = await resp.json()
-            if not installers:
-                return None
-            installer_version = installers[0]["version"]
-
+        meta = f"{self.api_base}/v2/versions"
+        latest = await _latest_loader_and_installer(meta, session)
+        if latest is None:
+            return None
+        loader_version, installer_version = latest
         return (
             f"{self.api_base}/v2/versions/loader/{version}/{loader_version}"
             f"/{installer_version}/server/jar"
@@ -505,26 +1213,11 @@ class ServerType:
         self, version: str, session: aiohttp.ClientSession
     ) -> Optional[str]:
         """Resolve Quilt server installer URL."""
-        # Get latest loader
-        loader_url = "https://meta.quiltmc.org/v3/versions/loader"
-        async with session.get(loader_url) as resp:
-            if resp.status != 200:
-                return None
-            loaders = await resp.json()
-            if not loaders:
-                return None
-            loader_version = loaders[0]["version"]
-
-        # Get latest installer
-        installer_url = "https://meta.quiltmc.org/v3/versions/installer"
-        async with session.get(installer_url) as resp:
-            if resp.status != 200:
-                return None
-            installers = await resp.json()
-            if not installers:
-                return None
-            installer_version = installers[0]["version"]
-
+        meta = "https://meta.quiltmc.org/v3/versions"
+        latest = await _latest_loader_and_installer(meta, session)
+        if latest is None:
+            return None
+        loader_version, installer_version = latest
         return (
             f"https://meta.quiltmc.org/v3/versions/loader/{version}/"
             f"{loader_version}/{installer_version}/server/jar"
@@ -552,21 +1245,7 @@ class ServerType:
         self, version: str, session: aiohttp.ClientSession
     ) -> Optional[str]:
         """Resolve Velocity proxy download URL."""
-        builds_url = f"{self.api_base}/v2/projects/velocity/versions/{version}/builds"
-        async with session.get(builds_url) as resp:
-            if resp.status != 200:
-                return None
-            data = await resp.json()
-            builds = data.get("builds", [])
-            if not builds:
-                return None
-            latest = builds[-1]
-            build_num = latest["build"]
-            jar_name = latest["downloads"]["application"]["name"]
-            return (
-                f"{self.api_base}/v2/projects/velocity/versions/{version}"
-                f"/builds/{build_num}/downloads/{jar_name}"
-            )
+        return await self._papermc_download_url("velocity", version, session)
 
     async def _bungeecord_download_url(
         self, version: str, session: aiohttp.ClientSession
@@ -576,12 +1255,26 @@ class ServerType:
         # Return the latest build
         return "https://ci.md-5.net/job/BungeeCord/lastSuccessfulBuild/artifact/bootstrap/target/BungeeCord.jar"
 
+    # software → resolver, called unbound as handler(self, version, session)
+    _DOWNLOAD_HANDLERS: ClassVar[
+        Dict[ServerSoftware, Callable[..., Awaitable[Optional[str]]]]
+    ] = {
+        ServerSoftware.PAPER: _paper_download_url,
+        ServerSoftware.PURPUR: _purpur_download_url,
+        ServerSoftware.VANILLA: _vanilla_download_url,
+        ServerSoftware.FABRIC: _fabric_download_url,
+        ServerSoftware.QUILT: _quilt_download_url,
+        ServerSoftware.FORGE: _forge_download_url,
+        ServerSoftware.VELOCITY: _velocity_download_url,
+        ServerSoftware.BUNGEECORD: _bungeecord_download_url,
+    }
+
 
 # ──────────────────────────────────────────────
 #  Server Type Registry
 # ──────────────────────────────────────────────
 
-SERVER_TYPES: Dict[str, ServerType] = {
+_SERVER_TYPES: Dict[str, ServerType] = {
     "vanilla": ServerType(
         name="Vanilla",
         software=ServerSoftware.VANILLA,
@@ -702,6 +1395,10 @@ SERVER_TYPES: Dict[str, ServerType] = {
     ),
 }
 
+# Read-only view: the registry is fixed at import and shared by every caller.
+# Keys are lowercase literals (already interned by the compiler).
+SERVER_TYPES: Mapping[str, ServerType] = MappingProxyType(_SERVER_TYPES)
+
 
 # ──────────────────────────────────────────────
 #  Public API Functions
@@ -717,7 +1414,8 @@ def get_server_type(name: str) -> Optional[ServerType]:
     Returns:
         ServerType or None if not found
     """
-    return SERVER_TYPES.get(name.lower())
+    # Names are almost always passed lowercase already; skip the copy then
+    return SERVER_TYPES.get(name if name.islower() else name.lower())
 
 
 def get_all_server_types() -> List[ServerType]:
@@ -740,7 +1438,7 @@ async def download_server_software(
     server_type: str,
     version: str,
     dest_path: str | Path,
-    session: aiohttp.ClientSession,
+    session: Optional[aiohttp.ClientSession] = None,
     progress_callback: Optional[Callable[[int, int], None]] = None,
 ) -> Result:
     """
@@ -750,7 +1448,7 @@ async def download_server_software(
         server_type:       Server type name (e.g. "paper")
         version:           Minecraft version (e.g. "1.20.4")
         dest_path:         Destination file path
-        session:           aiohttp session
+        session:           aiohttp session (default: the shared pooled session)
         progress_callback: Optional callback(downloaded, total)
 
     Returns:
@@ -768,14 +1466,14 @@ async def download_server_software(
 
 async def get_available_versions(
     server_type: str,
-    session: aiohttp.ClientSession,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> List[str]:
     """
     Get list of available MC versions for a server type.
 
     Args:
         server_type: Server type name (e.g. "paper")
-        session:     aiohttp session
+        session:     aiohttp session (default: the shared pooled session)
 
     Returns:
         List of version strings, newest first
@@ -788,10 +1486,41 @@ async def get_available_versions(
     return await stype.get_available_versions(session)
 
 
+# Upper bound on simultaneous version fetches during a prefetch
+PREFETCH_CONCURRENCY = 10
+
+
+async def prefetch_all_versions(
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Dict[str, List[str]]:
+    """
+    Fetch every registered server type's version list concurrently.
+
+    Fills the version cache as a side effect, so later per-type lookups
+    are served locally. Types without a versions API map to [].
+
+    Args:
+        session: aiohttp session (default: the shared pooled session)
+
+    Returns:
+        Dict of server type name → versions, newest first
+    """
+    session = session or get_shared_session()
+    limit = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+    async def _one(stype: ServerType) -> List[str]:
+        async with limit:
+            return await stype.get_available_versions(session)
+
+    names = list(SERVER_TYPES)
+    results = await asyncio.gather(*(_one(SERVER_TYPES[n]) for n in names))
+    return dict(zip(names, results))
+
+
 async def is_version_supported(
     server_type: str,
     version: str,
-    session: aiohttp.ClientSession,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> bool:
     """
     Check if a specific version is available for a server type.
@@ -799,7 +1528,7 @@ async def is_version_supported(
     Args:
         server_type: Server type name (e.g. "paper")
         version:     Minecraft version (e.g. "1.20.4")
-        session:     aiohttp session
+        session:     aiohttp session (default: the shared pooled session)
 
     Returns:
         True if the version is supported
@@ -809,3 +1538,26 @@ async def is_version_supported(
         return False
 
     return await stype.is_version_supported(version, session)
+
+
+async def is_versions_supported(
+    server_type: str,
+    versions: Iterable[str],
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Dict[str, bool]:
+    """
+    Check several versions for a server type with a single lookup.
+
+    Args:
+        server_type: Server type name (e.g. "paper")
+        versions:    Minecraft versions to check
+        session:     aiohttp session (default: the shared pooled session)
+
+    Returns:
+        Dict of version → True if supported (all False for unknown types)
+    """
+    stype = get_server_type(server_type)
+    if not stype:
+        return {v: False for v in versions}
+
+    return await stype.is_versions_supported(versions, session)
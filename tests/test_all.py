@@ -4,21 +4,49 @@ test_all.py
 ===========
 Comprehensive test suite for Minecraft Server Manager.
 
-Usage:
-    pytest test_all.py -v
-    pytest test_all.py -v -k java
-    pytest test_all.py -v --cov=.
+Usage (from the repository root, so the app modules are importable):
+    python -m pytest tests/test_all.py -v
+    python -m pytest tests/test_all.py -v -k java
+    python -m pytest tests/test_all.py -v --cov=.
+    python -m pytest tests/test_all.py -n auto   # parallel, needs pytest-xdist
+
+Every test keeps its files under tmp_path / tmp_path_factory (registries
+included), so the suite is safe to spread across xdist workers. Async
+tests share one module-scoped event loop (loop_scope="module").
 """
 
+import asyncio
+import hashlib
+import io
 import json
-import tempfile
+import os
+import threading
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, Mock, mock_open, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 from datetime import datetime
 import zipfile
 
 import pytest
 
+from eula_manager import EulaManager
+from file_editor import FileEditor
+from java_manager import JavaInstallation, JavaManager
+from plugin_apis import PluginDependency, PluginSearchResult
+from plugin_manager import PluginManager
+from plugin_validator import PluginValidator
+from server_manager import (
+    LOG_ERROR,
+    LOG_INFO,
+    LOG_PLAIN,
+    LOG_WARNING,
+    LogBuffer,
+    ServerManager,
+    ServerStatus,
+)
+import server_types
+from server_types import ServerSoftware, ServerType, get_server_type
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  FIXTURES
@@ -26,14 +54,7 @@ import pytest
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
-@pytest.fixture
-def mock_config(temp_dir):
+def mock_config(tmp_path):
     """Create a mock config.json file."""
     config = {
         "server": {
@@ -50,41 +71,67 @@ def mock_config(temp_dir):
             "port": 25565,
         },
         "paths": {
-            "server_dir": str(temp_dir / "server"),
-            "plugins_dir": str(temp_dir / "server" / "plugins"),
-            "backup_dir": str(temp_dir / "backups"),
-            "java_dir": str(temp_dir / "java"),
+            "server_dir": str(tmp_path / "server"),
+            "plugins_dir": str(tmp_path / "server" / "plugins"),
+            "backup_dir": str(tmp_path / "backups"),
+            "java_dir": str(tmp_path / "java"),
         },
     }
-    config_path = temp_dir / "config.json"
+    config_path = tmp_path / "config.json"
     config_path.write_text(json.dumps(config, indent=2))
     return config_path
 
 
+_SERVER_PROPERTIES = b"server-port=25565\ndifficulty=normal\nmax-players=20\n"
+_EULA_TXT = b"# EULA\neula=false\n"
+_EULA_ACCEPTED_TXT = b"# EULA\neula=true\n"
+
+
 @pytest.fixture
-def mock_server_dir(temp_dir):
+def mock_server_dir(tmp_path):
     """Create a mock server directory structure."""
-    server_dir = temp_dir / "server"
-    server_dir.mkdir(parents=True)
-    (server_dir / "plugins").mkdir(exist_ok=True)
-    (server_dir / "logs").mkdir(exist_ok=True)
+    server_dir = tmp_path / "server"
+    # Creating the children creates server_dir along the way
+    for child in ("plugins", "logs"):
+        os.makedirs(server_dir / child, exist_ok=True)
     
     # Create mock server.properties
-    props = server_dir / "server.properties"
-    props.write_text("server-port=25565\ndifficulty=normal\nmax-players=20\n")
+    (server_dir / "server.properties").write_bytes(_SERVER_PROPERTIES)
     
     # Create mock eula.txt
-    eula = server_dir / "eula.txt"
-    eula.write_text("# EULA\neula=false\n")
+    (server_dir / "eula.txt").write_bytes(_EULA_TXT)
     
     return server_dir
 
 
 @pytest.fixture
-def mock_java_dir(temp_dir):
+def accepted_eula(mock_server_dir):
+    """
+    Mock server directory with the EULA already accepted.
+
+    For tests that only need the post-acceptance state; tests of
+    auto_accept_eula() itself still call it.
+    """
+    (mock_server_dir / "eula.txt").write_bytes(_EULA_ACCEPTED_TXT)
+    return mock_server_dir
+
+
+@pytest.fixture
+def java_home(tmp_path):
+    """
+    Java directory path with nothing on disk yet.
+
+    JavaManager creates the directory itself, so tests that never look
+    at an installation take this instead of mock_java_dir.
+    """
+    return tmp_path / "java"
+
+
+@pytest.fixture
+def mock_java_dir(java_home):
     """Create a mock Java installation directory."""
-    java_dir = temp_dir / "java"
-    java_dir.mkdir(parents=True)
+    java_dir = java_home
+    java_dir.mkdir(parents=True, exist_ok=True)
     
     # Create mock Java 17 installation
     java17 = java_dir / "jdk-17"
@@ -93,17 +140,16 @@ def mock_java_dir(temp_dir):
     bin_dir.mkdir()
     
     java_exe = bin_dir / "java.exe"
-    java_exe.write_text("mock java executable")
+    java_exe.write_bytes(b"mock java executable")
     
     return java_dir
 
 
-@pytest.fixture
-def mock_plugin_jar(temp_dir):
-    """Create a mock plugin JAR file."""
-    jar_path = temp_dir / "TestPlugin.jar"
-    
-    with zipfile.ZipFile(jar_path, 'w') as zf:
+@pytest.fixture(scope="session")
+def mock_plugin_jar_bytes():
+    """Encode a mock plugin JAR in memory (once per session)."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', compression=zipfile.ZIP_STORED) as zf:
         plugin_yml = """
 name: TestPlugin
 version: 1.0.0
@@ -111,31 +157,164 @@ main: com.example.TestPlugin
 author: TestAuthor
 """
         zf.writestr("plugin.yml", plugin_yml)
-    
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def mock_plugin_jar(tmp_path_factory, mock_plugin_jar_bytes):
+    """Mock plugin JAR on disk, for APIs that take a path (tests only read it)."""
+    jar_path = tmp_path_factory.mktemp("plugin") / "TestPlugin.jar"
+    jar_path.write_bytes(mock_plugin_jar_bytes)
     return jar_path
 
 
+@pytest.fixture(scope="module")
+def _java_run_stub():
+    """subprocess.run stand-in reporting Java 17 (built once per module)."""
+    return Mock(return_value=Mock(
+        returncode=0,
+        stdout="openjdk version \"17.0.1\" 2021-10-19\n",
+    ))
+
+
+@pytest.fixture
+def mock_java_run(monkeypatch, _java_run_stub):
+    """
+    Route java_manager's subprocess.run to the shared stub for one test.
+
+    Installed per test rather than module-wide: java_manager.subprocess
+    is the real subprocess module, so a lasting patch would also reach
+    ServerManager tests that shell out.
+    """
+    monkeypatch.setattr("java_manager.subprocess.run", _java_run_stub)
+    return _java_run_stub
+
+
+@pytest.fixture
+def java_manager(java_home):
+    """JavaManager over the (initially empty) Java directory."""
+    return JavaManager(java_home, java_home / "java_versions.json")
+
+
+@pytest.fixture
+def eula_manager(mock_server_dir, mock_config):
+    """EulaManager over the mock server directory."""
+    return EulaManager(mock_server_dir, mock_config)
+
+
+@pytest.fixture
+def file_editor(mock_server_dir):
+    """FileEditor over the mock server directory."""
+    return FileEditor(mock_server_dir)
+
+
+@pytest.fixture
+def server_manager(mock_config):
+    """ServerManager loaded from the mock config."""
+    return ServerManager(mock_config)
+
+
+@pytest.fixture
+def plugin_manager(tmp_path):
+    """PluginManager for Paper 1.20.1 with an empty plugins directory."""
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir()
+    return PluginManager(
+        plugins_dir=plugins_dir,
+        registry_path=tmp_path / "installed_plugins.json",
+        server_type="paper",
+        mc_version="1.20.1",
+    )
+
+
 @pytest.fixture
 def mock_aiohttp_session():
-    """Mock aiohttp.ClientSession for API tests."""
-    session = AsyncMock()
-    
-    async def mock_get(*args, **kwargs):
-        response = AsyncMock()
-        response.status = 200
-        response.json = AsyncMock(return_value={
-            "hits": [],
-            "result": [],
-            "data": [],
-        })
-        response.text = AsyncMock(return_value="")
-        response.read = AsyncMock(return_value=b"")
+    """
+    Stand-in aiohttp.ClientSession for API tests.
+
+    Plain coroutines rather than AsyncMock: no test inspects call history,
+    so there is nothing to record. Use AsyncMock in a test that needs it.
+    """
+    async def _json(*args, **kwargs):
+        return {"hits": [], "result": [], "data": []}
+
+    async def _text(*args, **kwargs):
+        return ""
+
+    async def _read(*args, **kwargs):
+        return b""
+
+    # One canned response, shared by every simulated request
+    response = SimpleNamespace(status=200, json=_json, text=_text, read=_read)
+
+    async def _request(*args, **kwargs):
         return response
-    
-    session.get = mock_get
-    session.post = AsyncMock(return_value=AsyncMock(status=200))
-    
-    return session
+
+    return SimpleNamespace(get=_request, post=_request)
+
+
+class _FakeResponse:
+    """aiohttp response stand-in: status, headers and a body to stream."""
+
+    def __init__(self, status=200, body=b"", headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+        self.content = SimpleNamespace(iter_chunked=self._iter_chunked)
+
+    async def _iter_chunked(self, size):
+        for start in range(0, len(self._body), size):
+            yield self._body[start:start + size]
+
+    async def read(self):
+        return self._body
+
+    def release(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeSession:
+    """aiohttp session stand-in serving queued responses in order."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []  # (url, headers) per GET
+
+    async def get(self, url, headers=None, **kwargs):
+        self.requests.append((url, dict(headers or {})))
+        await asyncio.sleep(0)  # let concurrent callers interleave
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def version_cache(tmp_path, monkeypatch):
+    """
+    Empty server_types version cache, persisted under tmp_path.
+
+    Keeps tests off the developer's ~/.cache/mcsm and turns off retry
+    backoff. The cache file is loaded on first lookup, from tmp_path.
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(server_types, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(server_types, "VERSIONS_CACHE_FILE", cache_dir / "versions.json")
+    monkeypatch.setattr(server_types, "MOJANG_CACHE_DIR", cache_dir / "mojang")
+    monkeypatch.setattr(server_types, "_VERSIONS_CACHE", {})
+    monkeypatch.setattr(server_types, "_VERSIONS_INFLIGHT", {})
+    monkeypatch.setattr(server_types, "_versions_cache_loaded", False)
+    monkeypatch.setattr(server_types, "RETRY_BASE_DELAY", 0.0)
+    return cache_dir
+
+
+def _versions_response(versions, status=200, etag='"v1"'):
+    """PaperMC-style versions listing."""
+    body = json.dumps({"versions": versions}).encode()
+    return _FakeResponse(status, body, {"ETag": etag})
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -143,46 +322,26 @@ def mock_aiohttp_session():
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def test_java_manager_init(mock_java_dir):
+def test_java_manager_init(java_home, java_manager):
     """Test JavaManager initialization."""
-    from java_manager import JavaManager
-    
-    jm = JavaManager(mock_java_dir, "java_versions.json")
-    
-    assert jm.java_dir == mock_java_dir
-    assert jm.registry_path.name == "java_versions.json"
+    assert java_manager.java_dir == java_home
+    assert java_manager.registry_path.name == "java_versions.json"
 
 
-@patch("java_manager.subprocess.run")
-def test_detect_java_versions(mock_run, mock_java_dir):
+def test_detect_java_versions(mock_java_run, java_manager):
     """Test Java version detection."""
-    from java_manager import JavaManager
-    
-    # Mock subprocess output
-    mock_run.return_value = Mock(
-        returncode=0,
-        stdout="openjdk version \"17.0.1\" 2021-10-19\n"
-    )
+    found = java_manager.detect_system_java()
     
-    jm = JavaManager(mock_java_dir, "java_versions.json")
-    found = jm.detect_system_java()
-    
-    assert isinstance(found, list)
     # Detection might find 0 or more depending on mock setup
-    assert len(found) >= 0
+    assert isinstance(found, list)
 
 
-@patch("java_manager.subprocess.run")
-def test_java_compatibility_check(mock_run, mock_java_dir):
+def test_java_compatibility_check(mock_java_run, java_home, java_manager):
     """Test Java version compatibility checking."""
-    from java_manager import JavaManager, JavaInstallation
-    
-    jm = JavaManager(mock_java_dir, "java_versions.json")
-    
     # Mock a Java 17 installation
     java17 = JavaInstallation(
         version=17,
-        path=str(mock_java_dir / "jdk-17"),
+        path=str(java_home / "jdk-17"),
         vendor="OpenJDK",
         install_date=datetime.now().isoformat(),
     )
@@ -194,10 +353,6 @@ def test_java_compatibility_check(mock_run, mock_java_dir):
 
 def test_validate_java_path(mock_java_dir):
     """Test Java path validation."""
-    from java_manager import JavaManager
-    
-    jm = JavaManager(mock_java_dir, "java_versions.json")
-    
     # Valid path (exists)
     valid_path = mock_java_dir / "jdk-17"
     valid_path.mkdir(exist_ok=True)
@@ -209,17 +364,13 @@ def test_validate_java_path(mock_java_dir):
     assert not invalid_path.exists()
 
 
-@pytest.mark.asyncio
-async def test_install_java_mock(mock_java_dir, mock_aiohttp_session):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_install_java_mock(mock_aiohttp_session, java_manager):
     """Test Java installation with mocked download."""
-    from java_manager import JavaManager
-    
-    jm = JavaManager(mock_java_dir, "java_versions.json")
-    
     # Mock the download to return success without actual download
-    with patch.object(jm, '_download_file', return_value=True):
-        with patch.object(jm, '_extract_archive', return_value=True):
-            result = await jm.download_java(17, mock_aiohttp_session)
+    with patch.object(java_manager, '_download_file', return_value=True):
+        with patch.object(java_manager, '_extract_archive', return_value=True):
+            result = await java_manager.download_java(17, mock_aiohttp_session)
             
             # Since we're mocking, result depends on implementation
             # At minimum, no exception should be raised
@@ -231,78 +382,53 @@ async def test_install_java_mock(mock_java_dir, mock_aiohttp_session):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def test_eula_manager_init(mock_server_dir, mock_config):
+def test_eula_manager_init(mock_server_dir, eula_manager):
     """Test EulaManager initialization."""
-    from eula_manager import EulaManager
-    
-    em = EulaManager(mock_server_dir, mock_config)
-    
-    assert em.server_dir == mock_server_dir
-    assert em.eula_path == mock_server_dir / "eula.txt"
+    assert eula_manager.server_dir == mock_server_dir
+    assert eula_manager.eula_path == mock_server_dir / "eula.txt"
 
 
-def test_eula_check_status_false(mock_server_dir, mock_config):
+def test_eula_check_status_false(eula_manager):
     """Test EULA status when not accepted."""
-    from eula_manager import EulaManager
-    
-    em = EulaManager(mock_server_dir, mock_config)
-    
     # Default eula.txt has eula=false
-    assert em.check_eula_status() is False
+    assert eula_manager.check_eula_status() is False
 
 
-def test_eula_acceptance(mock_server_dir, mock_config):
+def test_eula_acceptance(mock_server_dir, eula_manager):
     """Test EULA acceptance."""
-    from eula_manager import EulaManager
-    
-    em = EulaManager(mock_server_dir, mock_config)
-    
-    result = em.auto_accept_eula()
+    result = eula_manager.auto_accept_eula()
     
     assert result.success is True
-    assert em.check_eula_status() is True
+    assert eula_manager.check_eula_status() is True
     
     # Verify file content
     eula_content = (mock_server_dir / "eula.txt").read_text()
     assert "eula=true" in eula_content
 
 
-def test_eula_validation(mock_server_dir, mock_config):
+def test_eula_validation(eula_manager):
     """Test EULA validation."""
-    from eula_manager import EulaManager
-    
-    em = EulaManager(mock_server_dir, mock_config)
-    
     # Initially invalid (eula=false)
-    assert em.validate_eula() is False
+    assert eula_manager.validate_eula() is False
     
     # Accept and validate
-    em.auto_accept_eula()
-    assert em.validate_eula() is True
+    eula_manager.auto_accept_eula()
+    assert eula_manager.validate_eula() is True
 
 
-def test_eula_decline(mock_server_dir, mock_config):
+def test_eula_decline(accepted_eula, eula_manager):
     """Test EULA decline."""
-    from eula_manager import EulaManager
-    
-    em = EulaManager(mock_server_dir, mock_config)
-    
-    # Accept first
-    em.auto_accept_eula()
-    assert em.check_eula_status() is True
+    # Accepted by the fixture
+    assert eula_manager.check_eula_status() is True
     
     # Then decline
-    em.decline()
-    assert em.check_eula_status() is False
+    eula_manager.decline()
+    assert eula_manager.check_eula_status() is False
 
 
-def test_eula_get_text(mock_server_dir, mock_config):
+def test_eula_get_text(eula_manager):
     """Test retrieving EULA text."""
-    from eula_manager import EulaManager
-    
-    em = EulaManager(mock_server_dir, mock_config)
-    
-    text = em.get_eula_text()
+    text = eula_manager.get_eula_text()
     
     assert isinstance(text, str)
     assert len(text) > 100  # Should be substantial legal text
@@ -314,102 +440,73 @@ def test_eula_get_text(mock_server_dir, mock_config):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def test_file_editor_init(mock_server_dir):
+def test_file_editor_init(mock_server_dir, file_editor):
     """Test FileEditor initialization."""
-    from file_editor import FileEditor
-    
-    fe = FileEditor(mock_server_dir)
-    
-    assert fe.server_dir == Path(mock_server_dir)
+    assert file_editor.server_dir == Path(mock_server_dir)
 
 
-def test_read_file(mock_server_dir):
+def test_read_file(mock_server_dir, file_editor):
     """Test reading a file."""
-    from file_editor import FileEditor
-    
-    fe = FileEditor(mock_server_dir)
-    
     # Read existing server.properties
     props_path = mock_server_dir / "server.properties"
-    content = fe.read_file(props_path)
+    content = file_editor.read_file(props_path)
     
     assert isinstance(content, str)
     assert "server-port" in content
 
 
-def test_write_file(mock_server_dir):
+def test_write_file(mock_server_dir, file_editor):
     """Test writing a file with backup."""
-    from file_editor import FileEditor
-    
-    fe = FileEditor(mock_server_dir)
-    
     test_file = mock_server_dir / "test.txt"
     test_content = "test content"
     
-    result = fe.write_file(test_file, test_content)
+    result = file_editor.write_file(test_file, test_content)
     
     assert result.success is True
     assert test_file.read_text() == test_content
 
 
-def test_validate_properties(mock_server_dir):
+def test_validate_properties(file_editor):
     """Test server.properties validation."""
-    from file_editor import FileEditor
-    
-    fe = FileEditor(mock_server_dir)
-    
     # Valid properties
     valid_props = "server-port=25565\ndifficulty=normal\n"
-    result = fe.validate_file_content("server.properties", valid_props)
+    result = file_editor.validate_file_content("server.properties", valid_props)
     assert result.success is True
     
     # Invalid properties (malformed)
     invalid_props = "server-port=\nno_equals_sign\n"
     # May or may not fail depending on validator strictness
     # Just ensure no exception
-    fe.validate_file_content("server.properties", invalid_props)
+    file_editor.validate_file_content("server.properties", invalid_props)
 
 
-def test_json_validation(mock_server_dir):
+def test_json_validation(file_editor):
     """Test JSON validation."""
-    from file_editor import FileEditor
-    
-    fe = FileEditor(mock_server_dir)
-    
     # Valid JSON
     valid_json = '{"key": "value"}'
-    result = fe.validate_file_content("config.json", valid_json)
+    result = file_editor.validate_file_content("config.json", valid_json)
     assert result.success is True
     
     # Invalid JSON
     invalid_json = '{"key": invalid}'
-    result = fe.validate_file_content("config.json", invalid_json)
+    result = file_editor.validate_file_content("config.json", invalid_json)
     assert result.success is False
 
 
-def test_backup_creation(mock_server_dir):
+def test_backup_creation(mock_server_dir, file_editor):
     """Test file backup creation."""
-    from file_editor import FileEditor
-    
-    fe = FileEditor(mock_server_dir)
-    
     props_path = mock_server_dir / "server.properties"
     original_content = props_path.read_text()
     
-    backup_path = fe.create_backup(props_path)
+    backup_path = file_editor.create_backup(props_path)
     
-    assert backup_path is not None
     assert Path(backup_path).exists()
     assert Path(backup_path).read_text() == original_content
 
 
-def test_list_editable_files(mock_server_dir):
+def test_list_editable_files(file_editor):
     """Test listing editable files."""
-    from file_editor import FileEditor
-    
-    fe = FileEditor(mock_server_dir)
-    
-    files = fe.list_editable_files()
+    files = file_editor.list_editable_files()
     
     assert isinstance(files, list)
     # Should find at least server.properties and eula.txt
@@ -425,129 +522,160 @@ def test_list_editable_files(mock_server_dir):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def test_server_manager_init(mock_config):
+def test_server_manager_init(mock_config, server_manager):
     """Test ServerManager initialization."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
-    assert sm.config_path == mock_config
-    assert sm.server_dir.exists()
+    assert server_manager.config_path == mock_config
+    assert server_manager.server_dir.exists()
 
 
-def test_config_loading(mock_config):
+def test_config_loading(server_manager):
     """Test configuration loading."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
-    cfg = sm.get_server_config()
+    cfg = server_manager.get_server_config()
     
     assert cfg["type"] == "paper"
     assert cfg["version"] == "1.20.1"
     assert cfg["ram"] == 2048
 
 
-def test_update_config(mock_config):
+def test_update_config(server_manager):
     """Test configuration updates."""
-    from server_manager import ServerManager
+    server_manager.update_server_config(ram=4096, max_players=50)
     
-    sm = ServerManager(mock_config)
-    
-    sm.update_server_config(ram=4096, max_players=50)
-    
-    cfg = sm.get_server_config()
+    cfg = server_manager.get_server_config()
     assert cfg["ram"] == 4096
     assert cfg["max_players"] == 50
 
 
-def test_server_properties_read(mock_server_dir, mock_config):
+def test_server_properties_read(mock_server_dir, server_manager):
     """Test reading server.properties."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
-    props = sm.get_server_properties()
+    props = server_manager.get_server_properties()
     
     assert isinstance(props, dict)
     assert "server-port" in props
     assert props["server-port"] == "25565"
 
 
-def test_server_properties_update(mock_server_dir, mock_config):
+def test_server_properties_update(mock_server_dir, server_manager):
     """Test updating server.properties."""
-    from server_manager import ServerManager
+    server_manager.update_server_properties("max-players", "100")
     
-    sm = ServerManager(mock_config)
-    
-    sm.update_server_properties("max-players", "100")
-    
-    props = sm.get_server_properties()
+    props = server_manager.get_server_properties()
     assert props["max-players"] == "100"
 
 
 @patch("server_manager.subprocess.Popen")
-def test_start_server_mock(mock_popen, mock_config, mock_server_dir):
+def test_start_server_mock(mock_popen, accepted_eula, server_manager):
     """Test server start with mocked subprocess."""
-    from server_manager import ServerManager
-    
     # Mock the process
     mock_process = Mock()
     mock_process.poll.return_value = None
     mock_process.pid = 12345
     mock_popen.return_value = mock_process
     
-    sm = ServerManager(mock_config)
-    
-    # Need EULA accepted and server JAR
-    sm.eula_manager.auto_accept_eula()
-    
-    # Create mock server JAR
-    jar_path = sm.server_dir / "server.jar"
-    jar_path.write_text("mock jar")
+    # EULA accepted by the fixture; still needs a server JAR
+    jar_path = server_manager.server_dir / "server.jar"
+    jar_path.write_bytes(b"mock jar")
     
     # Attempt to start (will fail prerequisite checks in reality)
     # But we're testing the mocking works
-    result = sm.start_server()
+    result = server_manager.start_server()
     
     # Result depends on prerequisites
     assert result is not None
 
 
-def test_jvm_flags_generation(mock_config):
+def test_jvm_flags_generation(server_manager):
     """Test JVM flags generation."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
-    flags = sm.get_jvm_flags()
+    flags = server_manager.get_jvm_flags()
     
-    assert isinstance(flags, str)
-    # Default profile should have flags
-    assert len(flags) > 0 or flags == ""
+    # No profile configured: "default" adds nothing, leaving the JVM's own
+    assert flags == ""
+    assert server_manager.get_jvm_flag_tokens() == ()
 
+    server_manager.update_config("server.jvm_profile", "zgc")
+    flags = server_manager.get_jvm_flags()
+    assert "-XX:+UseZGC" in flags.split()
+    assert server_manager.get_jvm_flag_tokens() == tuple(flags.split())
 
-def test_jvm_profile_setting(mock_config):
+    # Custom flags take precedence over the profile
+    assert server_manager.set_jvm_flags("-Xss1M -XX:+UseG1GC").success
+    assert server_manager.get_jvm_flags() == "-Xss1M -XX:+UseG1GC"
+    assert server_manager.get_jvm_flag_tokens() == ("-Xss1M", "-XX:+UseG1GC")
+
+
+def test_jvm_profile_setting(mock_config, server_manager):
     """Test setting JVM profile."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
-    # Set to aikar profile
-    sm.set_jvm_profile("aikar")
-    
-    cfg = sm.get_server_config()
-    # Profile may be stored or used directly
-    # Just ensure no exception
+    result = server_manager.set_jvm_profile("aikar")
+    
+    assert result.success
+    assert server_manager.get_server_config()["jvm_profile"] == "aikar"
+    assert json.loads(mock_config.read_text())["server"]["jvm_profile"] == "aikar"
+    assert server_manager.get_jvm_flags() == result.details["flags"]
+
+    assert not server_manager.set_jvm_profile("no-such-profile").success
+    assert server_manager.get_server_config()["jvm_profile"] == "aikar"
+
+
+def test_config_batch_defers_save(mock_config, server_manager):
+    """Test config writes inside config_batch() are saved once at the end."""
+    with server_manager.config_batch():
+        server_manager.update_config("server.ram", 4096)
+        server_manager.update_server_config(max_players=50)
+        assert json.loads(mock_config.read_text())["server"]["ram"] == 2048
+
+    saved = json.loads(mock_config.read_text())["server"]
+    assert saved["ram"] == 4096
+    assert saved["max_players"] == 50
+
+
+def test_prerequisite_cache(accepted_eula, server_manager, monkeypatch):
+    """Test prerequisite checks are reused until a file or the config changes."""
+    java_bin = accepted_eula / "java"
+    java_bin.write_bytes(b"")
+    jar = accepted_eula / "paper-1.20.1.jar"
+    jar.write_bytes(b"jar")
+    java = server_manager.java_manager
+    monkeypatch.setattr(java, "get_java_binary", lambda: str(java_bin))
+    monkeypatch.setattr(java, "get_active", lambda: SimpleNamespace(version=17))
+
+    runs = []
+    check_static = server_manager._check_static_prerequisites
+
+    def _counting_check(*args):
+        runs.append(args)
+        return check_static(*args)
+
+    monkeypatch.setattr(server_manager, "_check_static_prerequisites", _counting_check)
+    jar_lookups = []
+    get_jar = server_manager.get_server_jar
+    monkeypatch.setattr(
+        server_manager, "get_server_jar", lambda: jar_lookups.append(1) or get_jar()
+    )
+
+    assert server_manager.check_prerequisites().success
+    assert server_manager.check_prerequisites().success
+    assert len(runs) == 1
+    assert runs[0][1] == jar.resolve()
+    assert len(jar_lookups) == 1  # a hit reuses the resolved paths
 
+    # Touching the JAR or eula.txt rebuilds the checks
+    for path in (jar, accepted_eula / "eula.txt"):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert server_manager.check_prerequisites().success
+    assert len(runs) == 3
 
-def test_system_resources(mock_config):
+    # So does a config change whose save is still deferred by a batch
+    with server_manager.config_batch():
+        server_manager.update_config("server.version", "1.20.6")
+        result = server_manager.check_prerequisites()
+    assert len(runs) == 4
+    assert not result.details["checks"]["java_compat"]["ok"]  # needs Java 21
+
+
+def test_system_resources(server_manager):
     """Test system resource monitoring."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
-    resources = sm.get_system_resources()
+    resources = server_manager.get_system_resources()
     
     assert isinstance(resources, dict)
     assert "cpu_percent" in resources
@@ -555,14 +683,132 @@ def test_system_resources(mock_config):
     assert "disk_total_gb" in resources
 
 
-def test_is_running(mock_config):
+def test_status_cache(server_manager):
+    """Test status/resource polls are reused briefly and can be busted."""
+    resources = server_manager.get_system_resources()
+    status = server_manager.get_server_status()
+    assert server_manager.get_system_resources() is resources
+    assert server_manager.get_server_status() is status
+
+    server_manager.bust_cache()
+    assert server_manager.get_system_resources() is not resources
+    assert server_manager.get_server_status() is not status
+
+
+def test_log_buffer_levels():
+    """Test log lines are classified once when buffered."""
+    buf = LogBuffer(max_lines=3)
+    buf.append(b"[12:00:00 INFO]: Starting minecraft server")
+    buf.append(b"[12:00:01 WARN]: Can't keep up!")
+    buf.append(b"[12:00:02 ERROR]: Encountered an unexpected exception")
+    buf.append(b"\tat net.minecraft.server.Main")
+
+    # Oldest line evicted by max_lines
+    assert len(buf) == 3
+    assert buf.tail_entries(3) == [
+        ("[12:00:01 WARN]: Can't keep up!", LOG_WARNING),
+        ("[12:00:02 ERROR]: Encountered an unexpected exception", LOG_ERROR),
+        ("\tat net.minecraft.server.Main", LOG_PLAIN),
+    ]
+    assert buf.tail(1) == ["\tat net.minecraft.server.Main"]
+    assert LOG_INFO not in [level for _, level in buf.tail_entries(3)]
+
+    # Raw chunks may split lines anywhere
+    buf.clear()
+    buf.feed(b"[12:00:03 INFO]: Done\r\n[12:00:04 IN")
+    assert buf.tail(5) == ["[12:00:03 INFO]: Done"]
+    buf.feed(b"FO]: Saving")
+    buf.flush()
+    assert buf.tail_entries(1) == [("[12:00:04 INFO]: Saving", LOG_INFO)]
+
+    # Only the CR of a CRLF is stripped; trailing spaces are kept
+    buf.feed(b"> say hi  \r\n")
+    assert buf.tail(1) == ["> say hi  "]
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_log_stream(server_manager):
+    """Test log_stream yields the backlog, then entries pushed from a thread."""
+    server_manager._on_output(server_manager._log_buffer.feed(b"[12:00:00 INFO]: Old\n"))
+
+    stream = server_manager.log_stream(backlog=5)
+    assert await stream.__anext__() == [("[12:00:00 INFO]: Old", "info")]
+
+    feed = server_manager._log_buffer.feed
+    thread = threading.Thread(
+        target=server_manager._on_output,
+        args=(feed(b"[12:00:01 INFO]: New\r\n[12:00:02 WARN]: Lag\n"),),
+    )
+    thread.start()
+    thread.join()
+    # Levels come from capture time, not from re-reading the text
+    assert await asyncio.wait_for(stream.__anext__(), 1) == [
+        ("[12:00:01 INFO]: New", "info"),
+        ("[12:00:02 WARN]: Lag", "warning"),
+    ]
+
+    await stream.aclose()
+    assert server_manager._log_subscribers == []
+
+
+def test_backup_archive(mock_server_dir, server_manager, monkeypatch):
+    """Test background backups and cleanup of a failed archive."""
+    region = mock_server_dir / "world" / "region"
+    region.mkdir(parents=True)
+    (region / "r.0.0.mca").write_bytes(b"\0" * 4096)
+    (mock_server_dir / "world" / "level.json").write_bytes(b"{}" * 512)
+
+    token = server_manager.start_backup("nightly")
+    server_manager._backup_jobs[token].result(timeout=10)
+    result = server_manager.get_backup_status(token)
+    assert result.success, result.error
+    assert result.details["done"] is True
+    assert server_manager.get_backup_status(token).success  # still pollable
+
+    # Expired jobs are forgotten
+    monkeypatch.setattr(server_manager, "BACKUP_JOB_TTL", -1)
+    assert server_manager.get_backup_status(token).success is False
+    assert token not in server_manager._backup_jobs
+
+    with zipfile.ZipFile(result.details["path"]) as zf:
+        infos = {info.filename: info for info in zf.infolist()}
+    # Already-compressed region files are stored, the rest deflated
+    assert infos["world/region/r.0.0.mca"].compress_type == zipfile.ZIP_STORED
+    assert infos["world/level.json"].compress_type == zipfile.ZIP_DEFLATED
+    # Directories named like archives aren't backups
+    (server_manager.backup_dir / "extracted.zip").mkdir()
+    assert [b["name"] for b in server_manager.list_backups()] == ["nightly"]
+    (server_manager.backup_dir / "extracted.zip").rmdir()
+
+    def _disk_full(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(zipfile.ZipFile, "write", _disk_full)
+    result = server_manager.create_backup("broken")
+    assert not result.success
+    assert sorted(p.name for p in server_manager.backup_dir.iterdir()) == [
+        "nightly.zip"
+    ]
+
+
+def test_is_running(server_manager):
     """Test server running status check."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
     # Should not be running initially
-    assert sm.is_running() is False
+    assert server_manager.is_running() is False
+
+
+def test_status_tracked_from_output(server_manager):
+    """Test players and TPS are tracked as output chunks arrive."""
+    feed = server_manager._log_buffer.feed
+    server_manager._ingest_output(feed(b"[12:00:00 INFO]: Steve joined the game\n[12:00:01 INFO]: Al"))
+    server_manager._ingest_output(feed(b"ex joined the game\nTPS from last 1m, 5m, 15m: 19.5, 20.0, 20.0\n"))
+    server_manager._ingest_output(feed(b"[12:00:02 INFO]: Steve left the game\n"))
+
+    status = ServerStatus()
+    server_manager._parse_status_from_logs(status)
+    assert status.players_online == 1
+    assert status.player_names == ["Alex"]
+    assert status.tps == 19.5
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -570,41 +816,16 @@ def test_is_running(mock_config):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def test_plugin_manager_init(temp_dir):
+def test_plugin_manager_init(tmp_path, plugin_manager):
     """Test PluginManager initialization."""
-    from plugin_manager import PluginManager
-    
-    plugins_dir = temp_dir / "plugins"
-    plugins_dir.mkdir()
-    
-    pm = PluginManager(
-        plugins_dir=plugins_dir,
-        registry_path="installed_plugins.json",
-        server_type="paper",
-        mc_version="1.20.1",
-    )
-    
-    assert pm.plugins_dir == plugins_dir
-    assert pm.server_type == "paper"
-    assert pm.mc_version == "1.20.1"
+    assert plugin_manager.plugins_dir == tmp_path / "plugins"
+    assert plugin_manager.server_type == "paper"
+    assert plugin_manager.mc_version == "1.20.1"
 
 
-@pytest.mark.asyncio
-async def test_plugin_search_mock(temp_dir, mock_aiohttp_session):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_plugin_search_mock(mock_aiohttp_session, plugin_manager):
     """Test plugin search with mocked API."""
-    from plugin_manager import PluginManager
-    from plugin_apis import PluginSearchResult
-    
-    plugins_dir = temp_dir / "plugins"
-    plugins_dir.mkdir()
-    
-    pm = PluginManager(
-        plugins_dir=plugins_dir,
-        registry_path="installed_plugins.json",
-        server_type="paper",
-        mc_version="1.20.1",
-    )
-    
     # Mock search results
     with patch("plugin_manager.search_plugins") as mock_search:
         mock_search.return_value = [
@@ -622,86 +843,54 @@ async def test_plugin_search_mock(temp_dir, mock_aiohttp_session):
             )
         ]
         
-        results = await pm.search_plugins("test", session=mock_aiohttp_session)
+        results = await plugin_manager.search_plugins("test", session=mock_aiohttp_session)
         
         assert len(results) > 0
         assert results[0].name == "TestPlugin"
 
 
-def test_plugin_compatibility_check(temp_dir, mock_plugin_jar):
+def test_plugin_compatibility_check(tmp_path, mock_plugin_jar):
     """Test plugin compatibility validation."""
-    from plugin_validator import PluginValidator
-    
     validator = PluginValidator(
-        plugins_dir=temp_dir,
+        plugins_dir=tmp_path,
         server_type="paper",
         mc_version="1.20.1",
     )
     
     result = validator.validate(mock_plugin_jar)
     
-    assert result is not None
-    assert hasattr(result, 'is_valid')
+    assert result.is_valid
+    assert result.plugin_name == "TestPlugin"
+    assert not [i for i in result.issues if i.severity == "error"]
 
 
-def test_install_from_file(temp_dir, mock_plugin_jar):
+def test_install_from_file(mock_plugin_jar, plugin_manager):
     """Test installing plugin from local file."""
-    from plugin_manager import PluginManager
-    
-    plugins_dir = temp_dir / "plugins"
-    plugins_dir.mkdir()
-    
-    pm = PluginManager(
-        plugins_dir=plugins_dir,
-        registry_path="installed_plugins.json",
-        server_type="paper",
-        mc_version="1.20.1",
-    )
+    result = plugin_manager.install_from_file(mock_plugin_jar)
     
-    result = pm.install_from_file(mock_plugin_jar)
-    
-    # Should succeed or fail validation gracefully
-    assert result is not None
-    assert hasattr(result, 'success')
+    assert result.success, result.error
+    assert (plugin_manager.plugins_dir / "TestPlugin.jar").exists()
 
+    plugin = plugin_manager.get_plugin("TestPlugin")
+    assert plugin is not None
+    assert plugin.version == "1.0.0"
+    assert plugin.source == "manual"
+    registry = json.loads(plugin_manager.registry_path.read_text())
+    assert [p["name"] for p in registry["plugins"]] == ["TestPlugin"]
 
-def test_get_installed_plugins(temp_dir):
+
+def test_get_installed_plugins(plugin_manager):
     """Test listing installed plugins."""
-    from plugin_manager import PluginManager
-    
-    plugins_dir = temp_dir / "plugins"
-    plugins_dir.mkdir()
-    
-    pm = PluginManager(
-        plugins_dir=plugins_dir,
-        registry_path="installed_plugins.json",
-        server_type="paper",
-        mc_version="1.20.1",
-    )
-    
-    installed = pm.get_installed_plugins()
+    installed = plugin_manager.get_installed_plugins()
     
     assert isinstance(installed, list)
     # Should be empty initially
     assert len(installed) == 0
 
 
-@pytest.mark.asyncio
-async def test_dependency_resolution_mock(temp_dir, mock_aiohttp_session):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_dependency_resolution_mock(mock_aiohttp_session, plugin_manager):
     """Test plugin dependency resolution."""
-    from plugin_manager import PluginManager
-    from plugin_apis import PluginSearchResult, PluginDependency
-    
-    plugins_dir = temp_dir / "plugins"
-    plugins_dir.mkdir()
-    
-    pm = PluginManager(
-        plugins_dir=plugins_dir,
-        registry_path="installed_plugins.json",
-        server_type="paper",
-        mc_version="1.20.1",
-    )
-    
     # Mock plugin with dependency
     with patch("plugin_manager.get_plugin_dependencies") as mock_deps:
         mock_deps.return_value = [
@@ -713,7 +902,7 @@ async def test_dependency_resolution_mock(temp_dir, mock_aiohttp_session):
             )
         ]
         
-        deps = await pm._install_dependencies(
+        deps = await plugin_manager._install_dependencies(
             PluginSearchResult(
                 id="main-plugin",
                 name="MainPlugin",
@@ -730,51 +919,176 @@ async def test_dependency_resolution_mock(temp_dir, mock_aiohttp_session):
         assert deps is not None
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  6. SERVER TYPES TESTS
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_versions_cache_expiry_and_revalidation(version_cache):
+    """Test cached version lists are reused, then revalidated with a 304."""
+    paper = get_server_type("paper")
+    session = _FakeSession(_versions_response(["1.20.1", "1.20.4"]))
+
+    assert await paper.get_available_versions(session) == ["1.20.1", "1.20.4"]
+    assert await paper.is_version_supported("1.20.4", session)
+    assert len(session.requests) == 1
+
+    # Expired: refetched conditionally, and a 304 keeps the stale list
+    _, versions, members, validators = server_types._VERSIONS_CACHE[ServerSoftware.PAPER]
+    server_types._VERSIONS_CACHE[ServerSoftware.PAPER] = (0.0, versions, members, validators)
+    session.responses.append(_FakeResponse(304))
+
+    assert await paper.get_available_versions(session) == ["1.20.1", "1.20.4"]
+    assert session.requests[1][1]["If-None-Match"] == '"v1"'
+    assert server_types._VERSIONS_CACHE[ServerSoftware.PAPER][0] > 0.0
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_versions_single_flight(version_cache):
+    """Test concurrent lookups on a cold cache share one request."""
+    paper = get_server_type("paper")
+    session = _FakeSession(_versions_response(["1.20.4"]))
+
+    results = await asyncio.gather(
+        *(paper.get_latest_version(session) for _ in range(5))
+    )
+    assert results == ["1.20.4"] * 5
+    assert len(session.requests) == 1
+    assert not server_types._VERSIONS_INFLIGHT
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_versions_retry_on_server_error(version_cache):
+    """Test a 5xx is retried before the version list is given up on."""
+    paper = get_server_type("paper")
+    session = _FakeSession(
+        _FakeResponse(503), _FakeResponse(502), _versions_response(["1.20.4"])
+    )
+
+    assert await paper.get_available_versions(session) == ["1.20.4"]
+    assert len(session.requests) == 3
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_versions_cache_persisted(version_cache):
+    """Test fetched lists are written to disk and loaded by a fresh process."""
+    paper = get_server_type("paper")
+    await paper.get_available_versions(_FakeSession(_versions_response(["1.20.4"])))
+    assert (version_cache / "versions.json").exists()
+
+    # As in a new process: nothing in memory, file not read yet
+    server_types._VERSIONS_CACHE.clear()
+    server_types._versions_cache_loaded = False
+
+    # Loaded on first lookup, and still fresh: served without a request
+    session = _FakeSession()
+    assert await paper.get_available_versions(session) == ["1.20.4"]
+    assert session.requests == []
+    _, _, _, validators = server_types._VERSIONS_CACHE[ServerSoftware.PAPER]
+    assert validators == {"If-None-Match": '"v1"'}
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_download_resume_and_checksum(tmp_path, monkeypatch):
+    """Test a kept .part resumes via Range and is verified as a whole."""
+    body = bytes(range(256)) * 2048  # 512 KiB: several download chunks
+    url = "https://example.invalid/paper-1.20.1.jar"
+
+    async def _download_url(self, version, session=None):
+        return url
+
+    monkeypatch.setattr(ServerType, "get_download_url", _download_url)
+    monkeypatch.setitem(
+        server_types._DOWNLOAD_SHA256, url, hashlib.sha256(body).hexdigest()
+    )
+    paper = get_server_type("paper")
+    dest = tmp_path / "server" / "server.jar"
+    part = dest.with_name("server.jar.part")
+
+    def _partial_response(offset):
+        rest = body[offset:]
+        return _FakeResponse(206, rest, {"Content-Length": str(len(rest))})
+
+    dest.parent.mkdir()
+    part.write_bytes(body[:1000])
+    session = _FakeSession(_partial_response(1000))
+    result = await paper.download_server("1.20.1", dest, session=session)
+
+    assert result.success, result.error
+    assert result.details["resumed_from"] == 1000
+    assert session.requests[0][1]["Range"] == "bytes=1000-"
+    assert dest.read_bytes() == body
+    assert not part.exists()
+
+    # Kept bytes that don't belong to this build fail the checksum
+    part.write_bytes(b"\0" * 1000)
+    session = _FakeSession(_partial_response(1000))
+    result = await paper.download_server("1.20.1", dest, session=session)
+
+    assert not result.success
+    assert "Checksum mismatch" in result.message
+    assert not part.exists()
+
+    # A .part left at its preallocated size was never trimmed: start over
+    part.write_bytes(body[:1000] + b"\0" * (len(body) - 1000))
+    dest.with_name("server.jar.part.size").write_text(str(len(body)))
+    session = _FakeSession(
+        _FakeResponse(200, body, {"Content-Length": str(len(body))})
+    )
+    result = await paper.download_server("1.20.1", dest, session=session)
+
+    assert result.success, result.error
+    assert "Range" not in session.requests[0][1]
+    assert dest.read_bytes() == body
+    assert not dest.with_name("server.jar.part.size").exists()
+
+
+def test_shared_session_per_loop():
+    """Test a new event loop replaces the shared session and closes the old one."""
+    async def _session():
+        return server_types.get_shared_session()
+
+    first = asyncio.run(_session())
+    second = asyncio.run(_session())
+    try:
+        assert second is not first
+        assert first.closed
+        assert not server_types._retired_sessions
+    finally:
+        asyncio.run(server_types.close_shared_session())
+    assert second.closed
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  INTEGRATION TESTS
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def test_full_setup_workflow(mock_config, mock_server_dir):
+def test_full_setup_workflow(mock_server_dir, server_manager):
     """Integration test: Full server setup workflow."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
     # 1. Accept EULA
-    eula_result = sm.eula_manager.auto_accept_eula()
+    eula_result = server_manager.eula_manager.auto_accept_eula()
     assert eula_result.success is True
     
     # 2. Generate server.properties
-    sm.generate_server_properties()
-    props = sm.get_server_properties()
+    server_manager.generate_server_properties()
+    props = server_manager.get_server_properties()
     assert "server-port" in props
     
     # 3. Check prerequisites
-    prereq_result = sm.check_prerequisites()
+    prereq_result = server_manager.check_prerequisites()
     # Will likely fail some checks (no JAR, no Java) but shouldn't crash
     assert prereq_result is not None
 
 
-def test_plugin_install_workflow(temp_dir, mock_plugin_jar):
+def test_plugin_install_workflow(mock_plugin_jar, plugin_manager):
     """Integration test: Plugin installation workflow."""
-    from plugin_manager import PluginManager
-    
-    plugins_dir = temp_dir / "plugins"
-    plugins_dir.mkdir()
-    
-    pm = PluginManager(
-        plugins_dir=plugins_dir,
-        registry_path="installed_plugins.json",
-        server_type="paper",
-        mc_version="1.20.1",
-    )
-    
     # 1. Install from file
-    result = pm.install_from_file(mock_plugin_jar)
+    result = plugin_manager.install_from_file(mock_plugin_jar)
     
     # 2. Check installed
-    installed = pm.get_installed_plugins()
+    installed = plugin_manager.get_installed_plugins()
     
     # May succeed or fail validation, but should handle gracefully
     assert result is not None
@@ -783,8 +1097,6 @@ def test_plugin_install_workflow(temp_dir, mock_plugin_jar):
 
 def test_config_persistence(mock_config):
     """Integration test: Config changes persist."""
-    from server_manager import ServerManager
-    
     sm1 = ServerManager(mock_config)
     sm1.update_server_config(ram=8192)
     
@@ -795,23 +1107,19 @@ def test_config_persistence(mock_config):
     assert cfg["ram"] == 8192
 
 
-def test_file_backup_restore_workflow(mock_server_dir):
+def test_file_backup_restore_workflow(mock_server_dir, file_editor):
     """Integration test: File backup and restore."""
-    from file_editor import FileEditor
-    
-    fe = FileEditor(mock_server_dir)
-    
     props_path = mock_server_dir / "server.properties"
     original = props_path.read_text()
     
     # 1. Create backup
-    backup = fe.create_backup(props_path)
+    backup = file_editor.create_backup(props_path)
     
     # 2. Modify file
-    fe.write_file(props_path, "modified content")
+    file_editor.write_file(props_path, "modified content")
     
     # 3. Restore backup
-    result = fe.restore_backup(props_path, backup)
+    result = file_editor.restore_backup(props_path, backup)
     
     assert result.success is True
     assert props_path.read_text() == original
@@ -824,57 +1132,37 @@ def test_file_backup_restore_workflow(mock_server_dir):
 
 def test_invalid_config_path():
     """Test handling of invalid config path."""
-    from server_manager import ServerManager
-    
     # Should create default config if missing
     sm = ServerManager("/nonexistent/config.json")
     
     assert sm.config is not None
 
 
-def test_missing_eula_file(temp_dir, mock_config):
+def test_missing_eula_file(tmp_path, mock_config):
     """Test handling of missing eula.txt."""
-    from eula_manager import EulaManager
-    
-    em = EulaManager(temp_dir, mock_config)
+    em = EulaManager(tmp_path, mock_config)
     
     # Should handle gracefully
     status = em.check_eula_status()
     assert status is False
 
 
-def test_corrupted_plugin_jar(temp_dir):
+def test_corrupted_plugin_jar(tmp_path, plugin_manager):
     """Test handling of corrupted plugin JAR."""
-    from plugin_manager import PluginManager
-    
-    plugins_dir = temp_dir / "plugins"
-    plugins_dir.mkdir()
-    
-    pm = PluginManager(
-        plugins_dir=plugins_dir,
-        registry_path="installed_plugins.json",
-        server_type="paper",
-        mc_version="1.20.1",
-    )
-    
     # Create corrupt JAR
-    corrupt_jar = temp_dir / "corrupt.jar"
-    corrupt_jar.write_text("not a valid zip file")
+    corrupt_jar = tmp_path / "corrupt.jar"
+    corrupt_jar.write_bytes(b"not a valid zip file")
     
-    result = pm.install_from_file(corrupt_jar)
+    result = plugin_manager.install_from_file(corrupt_jar)
     
     # Should fail gracefully
     assert result.success is False
 
 
-def test_file_read_error(mock_server_dir):
+def test_file_read_error(mock_server_dir, file_editor):
     """Test handling of file read errors."""
-    from file_editor import FileEditor
-    
-    fe = FileEditor(mock_server_dir)
-    
     # Try to read non-existent file
-    content = fe.read_file(mock_server_dir / "nonexistent.txt")
+    content = file_editor.read_file(mock_server_dir / "nonexistent.txt")
     
     # Should return empty or error message, not crash
     assert isinstance(content, str)
@@ -885,45 +1173,35 @@ def test_file_read_error(mock_server_dir):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def test_large_config_values(mock_config):
+def test_large_config_values(server_manager):
     """Test handling of large configuration values."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
     # Set very large RAM
-    sm.update_server_config(ram=65536)
+    server_manager.update_server_config(ram=65536)
     
-    cfg = sm.get_server_config()
+    cfg = server_manager.get_server_config()
     assert cfg["ram"] == 65536
 
 
-def test_special_characters_in_motd(mock_config):
+def test_special_characters_in_motd(server_manager):
     """Test handling of special characters in MOTD."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
     special_motd = "§aWelcome §l§nTest Server! 🌟"
-    sm.update_server_config(motd=special_motd)
+    server_manager.update_server_config(motd=special_motd)
     
-    cfg = sm.get_server_config()
+    cfg = server_manager.get_server_config()
     assert cfg["motd"] == special_motd
 
 
-def test_concurrent_config_access(mock_config):
+def test_concurrent_config_access(mock_config, server_manager):
     """Test concurrent access to configuration."""
-    from server_manager import ServerManager
-    
-    sm = ServerManager(mock_config)
-    
-    # Simulate rapid config updates
-    for i in range(10):
-        sm.update_server_config(port=25565 + i)
+    # Simulate rapid config updates; batched, so config.json is written once
+    with server_manager.config_batch():
+        for i in range(10):
+            server_manager.update_server_config(port=25565 + i)
     
-    cfg = sm.get_server_config()
-    # Should have last value
+    cfg = server_manager.get_server_config()
+    # Should have last value, in memory and on disk
     assert cfg["port"] == 25574
+    assert json.loads(mock_config.read_text())["server"]["port"] == 25574
 
 
 if __name__ == "__main__":
@@ -6,13 +6,20 @@ Main TUI dashboard — shows server status, console, and resource usage.
 
 from __future__ import annotations
 
+import asyncio
+import time
+from datetime import datetime
+
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, Container
+from textual.lazy import Lazy
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Label, Static, Input
 from textual.timer import Timer
+from textual.worker import get_current_worker
 
-from ui.widgets import StatusIndicator, ResourceBar, ServerLogView
+from ui.widgets import StatusIndicator, ResourcePanel, ServerLogView
 
 
 class DashboardScreen(Screen):
@@ -27,13 +34,30 @@ class DashboardScreen(Screen):
         ("q", "quit", "Quit"),
     ]
 
+    # Seconds between refreshes: running & focused / running / stopped
+    REFRESH_ACTIVE = 1.0
+    REFRESH_BACKGROUND = 5.0
+    REFRESH_IDLE = 30.0
+
+    # Minimum gap between console commands (swallows held-Enter repeats)
+    COMMAND_COOLDOWN = 0.1
+
+    # Console scrollback, and how much of it is shown on first mount
+    LOG_VIEW_LINES = 1000
+    LOG_BACKLOG = 30
+
     def __init__(self, server_manager) -> None:
         super().__init__()
         self.server_manager = server_manager
         self._refresh_timer: Timer | None = None
+        self._last_running = False
+        self._panels_ready = False  # set once the lazy panels are bound
+        self._last_command_at = 0.0
 
     def compose(self) -> ComposeResult:
-        yield Header(show_clock=True)
+        # No header clock: it repaints every second; the time is shown in
+        # #uptime-label on each (much rarer) status refresh instead
+        yield Header()
 
         with Container(id="dashboard"):
             # ── Status Panel (spans full width) ──
@@ -48,108 +72,212 @@ class DashboardScreen(Screen):
                     yield Button("↻ Restart", id="btn-restart", classes="action-btn btn-primary")
                     yield Button("💾 Backup", id="btn-backup", classes="action-btn btn-primary")
 
-            # ── Console Panel ──
-            with Vertical(id="console-panel", classes="panel"):
+            # ── Console Panel (mounted after the first paint) ──
+            with Lazy(Vertical(id="console-panel", classes="panel")):
                 yield Label("📋 Console", classes="panel-title")
-                yield ServerLogView(id="log-view")
+                yield ServerLogView(id="log-view", max_lines=self.LOG_VIEW_LINES)
                 yield Input(placeholder="Type server command…", id="cmd-input")
 
-            # ── Resources Panel ──
-            with Vertical(id="resources-panel", classes="panel"):
+            # ── Resources Panel (mounted after the first paint) ──
+            with Lazy(Vertical(id="resources-panel", classes="panel")):
                 yield Label("📊 System Resources", classes="panel-title")
-                yield ResourceBar(id="cpu-bar")
-                yield ResourceBar(id="ram-bar")
-                yield ResourceBar(id="disk-bar")
+                yield ResourcePanel(id="resources")
                 yield Label("", id="uptime-label")
 
         yield Footer()
 
     def on_mount(self) -> None:
-        """Initialize dashboard state and start refresh timer."""
-        # Configure resource bars
-        cpu_bar = self.query_one("#cpu-bar", ResourceBar)
-        cpu_bar.label = "CPU"
-        cpu_bar.unit = "%"
-
-        ram_bar = self.query_one("#ram-bar", ResourceBar)
-        ram_bar.label = "RAM"
-        ram_bar.unit = " MB"
-
-        disk_bar = self.query_one("#disk-bar", ResourceBar)
-        disk_bar.label = "Disk"
-        disk_bar.unit = " GB"
-
-        # Start periodic refresh
-        self._refresh_timer = self.set_interval(2.0, self._refresh_status)
+        """Initialize dashboard state; polling starts once panels mount."""
+        # Cache widget references so each refresh tick skips the DOM queries
+        self._indicator = self.query_one("#status-indicator", StatusIndicator)
+        self._server_info = self.query_one("#server-info", Label)
+
+        # Last rendered text, so unchanged ticks skip the repaint
+        self._last_info: str | None = None
+        self._last_clock: str | None = None
+        self._info_prefix_key: tuple[str, str] | None = None
+        self._info_prefix = ""
+
+        # The Lazy panels mount after the first refresh; this runs after them
+        self.call_after_refresh(self._bind_lazy_panels)
+
+    def _bind_lazy_panels(self) -> None:
+        """Cache the lazily mounted widgets, then start polling."""
+        self._resources = self.query_one("#resources", ResourcePanel)
+        self._log_view = self.query_one("#log-view", ServerLogView)
+        self._clock_label = self.query_one("#uptime-label", Label)
+        self._panels_ready = True
+
+        # The console is pushed to, not polled
+        self._follow_log(self.LOG_BACKLOG)
+
+        # First refresh now; each one then schedules the next
+        self._refresh_status()
+
+    def on_screen_suspend(self) -> None:
+        """Stop polling and following the log while another screen is on top."""
+        self._cancel_refresh()
+        # Unsubscribes: nothing queues up while the console is hidden
+        self.workers.cancel_group(self, "log-stream")
+
+    def on_screen_resume(self) -> None:
+        """Resume polling and redraw the console when shown again."""
+        if not self._panels_ready:
+            return  # _bind_lazy_panels starts both
+        # Output missed while hidden is read back from the server's log
+        # buffer, bounded by the view's own scrollback
+        self._log_view.clear()
+        self._follow_log(self.LOG_VIEW_LINES)
+        if self._refresh_timer is None:
+            self._refresh_soon()
+
+    def _refresh_interval(self) -> float:
+        """Pick the next refresh delay from server state and app focus."""
+        if not self._last_running:
+            return self.REFRESH_IDLE
+        return self.REFRESH_ACTIVE if self.app.app_focus else self.REFRESH_BACKGROUND
+
+    def _cancel_refresh(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
+
+    def _schedule_next_refresh(self) -> None:
+        """(Re)arm the one-shot refresh timer."""
+        self._cancel_refresh()
+        self._refresh_timer = self.set_timer(
+            self._refresh_interval(), self._refresh_status
+        )
+
+    def _refresh_soon(self) -> None:
+        """Refresh right after the current message instead of waiting."""
+        if not self._panels_ready:
+            return  # _bind_lazy_panels does the first refresh
+        self._cancel_refresh()
         self._refresh_status()
 
     def _refresh_status(self) -> None:
-        """Update all dashboard widgets with current server state."""
-        status = self.server_manager.get_status()
-        resources = self.server_manager.get_system_resources()
+        """Collect server state in the background; it applies itself."""
+        self._collect_status()
+
+    @work(thread=True, exclusive=True, group="refresh")
+    def _collect_status(self) -> None:
+        """
+        Poll the server manager off the UI thread.
+
+        Exclusive, so a slow psutil read is superseded by the next tick
+        instead of stacking up behind it.
+        """
+        sm = self.server_manager
+        status = sm.get_server_status()
+        resources = sm.get_system_resources()
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._apply_status, status, resources)
 
-        # Status indicator
-        indicator = self.query_one("#status-indicator", StatusIndicator)
-        indicator.is_running = status.running
+    def _apply_status(self, status, resources: dict) -> None:
+        """Write collected state to the widgets, then arm the next tick."""
+        self._last_running = status.running
 
-        # Server info
-        info_parts = [f"Type: {status.server_type.title()}", f"Version: {status.version}"]
+        # Server info; type and version rarely change, so that part is
+        # only rebuilt when they do
+        prefix_key = (status.server_type, status.version)
+        if prefix_key != self._info_prefix_key:
+            self._info_prefix_key = prefix_key
+            self._info_prefix = (
+                f"Type: {status.server_type.title()}  |  Version: {status.version}"
+            )
         if status.running:
             mins = int(status.uptime_seconds // 60)
-            info_parts.append(f"Uptime: {mins}m")
-            info_parts.append(f"RAM: {status.ram_used_mb:.0f} MB")
-        self.query_one("#server-info", Label).update("  |  ".join(info_parts))
-
-        # Resource bars
-        self.query_one("#cpu-bar", ResourceBar).value = resources["cpu_percent"]
-        ram_bar = self.query_one("#ram-bar", ResourceBar)
-        ram_bar.value = resources["ram_used_mb"]
-        ram_bar.max_value = resources["ram_total_mb"]
-        disk_bar = self.query_one("#disk-bar", ResourceBar)
-        disk_bar.value = resources["disk_used_gb"]
-        disk_bar.max_value = resources["disk_total_gb"]
-
-        # Log tail
-        log_view = self.query_one("#log-view", ServerLogView)
-        log_lines = self.server_manager.get_log_tail(30)
-        if log_lines:
-            log_view.load_lines(log_lines)
+            info = (
+                f"{self._info_prefix}  |  Uptime: {mins}m"
+                f"  |  RAM: {status.ram_used_mb:.0f} MB"
+            )
+        else:
+            info = self._info_prefix
+        clock = datetime.now().strftime("🕒 %H:%M")
+
+        # One repaint for the whole tick rather than one per widget
+        with self.app.batch_update():
+            # The status indicator is a reactive, which already skips the
+            # refresh when assigned an equal value
+            self._indicator.is_running = status.running
+            if info != self._last_info:
+                self._server_info.update(info)
+                self._last_info = info
+            if clock != self._last_clock:
+                self._clock_label.update(clock)
+                self._last_clock = clock
+
+            # Resource bars; CPU at display precision (whole numbers), so
+            # sampling noise doesn't defeat the panel's unchanged check.
+            # RAM/disk arrive pre-rounded.
+            self._resources.update_resources(
+                round(resources["cpu_percent"]),
+                resources["ram_used_mb"],
+                resources["ram_total_mb"],
+                resources["disk_used_gb"],
+                resources["disk_total_gb"],
+            )
+
+        # Suspended meanwhile: on_screen_resume restarts the cycle
+        if self.is_current:
+            self._schedule_next_refresh()
+
+    @work(exclusive=True, group="log-stream")
+    async def _follow_log(self, backlog: int) -> None:
+        """Append server output as it arrives; cancelled while hidden."""
+        async for entries in self.server_manager.log_stream(backlog=backlog):
+            if entries:
+                self._log_view.append_entries(entries)
 
     # ── Button Handlers ─────────────────────────
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        btn_id = event.button.id
-        if btn_id == "btn-start":
-            ok, msg = self.server_manager.start()
-            self.notify(msg, severity="information" if ok else "error")
-        elif btn_id == "btn-stop":
-            ok, msg = self.server_manager.stop()
-            self.notify(msg, severity="information" if ok else "error")
-        elif btn_id == "btn-restart":
-            ok, msg = self.server_manager.restart()
-            self.notify(msg, severity="information" if ok else "error")
-        elif btn_id == "btn-backup":
-            self.action_create_backup()
+    # Button id → ServerManager method returning a Result
+    _BUTTON_ACTIONS = {
+        "btn-start": "start_server",
+        "btn-stop": "stop_server",
+        "btn-restart": "restart_server",
+        "btn-backup": "create_backup",
+    }
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        method = self._BUTTON_ACTIONS.get(event.button.id)
+        if method is not None:
+            await self._run_server_action(method)
+
+    async def _run_server_action(self, method: str) -> None:
+        """Run a server_manager method off the event loop, then report it."""
+        # Start/stop/restart can block for seconds (JVM launch, shutdown
+        # wait), so they run off the event loop
+        result = await asyncio.to_thread(getattr(self.server_manager, method))
+        self.notify(
+            result.message, severity="information" if result.success else "error"
+        )
+        self._refresh_soon()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Send a command to the server console."""
-        if event.input.id == "cmd-input" and event.value.strip():
-            sent = self.server_manager.send_command(event.value.strip())
-            if sent:
-                self.notify(f"Sent: {event.value.strip()}")
-            else:
-                self.notify("Server not running", severity="error")
-            event.input.value = ""
+        if event.input.id != "cmd-input":
+            return
+        command = event.value.strip()
+        if not command:
+            return
+        now = time.monotonic()
+        if now - self._last_command_at < self.COMMAND_COOLDOWN:
+            return
+        self._last_command_at = now
+        result = self.server_manager.send_command(command)
+        if result.success:
+            self.notify(f"Sent: {command}")
+        else:
+            self.notify(result.message, severity="error")
+        event.input.value = ""
 
     # ── Actions ─────────────────────────────────
 
-    def action_toggle_server(self) -> None:
-        if self.server_manager.is_running():
-            ok, msg = self.server_manager.stop()
-        else:
-            ok, msg = self.server_manager.start()
-        self.notify(msg, severity="information" if ok else "error")
+    async def action_toggle_server(self) -> None:
+        method = "stop_server" if self.server_manager.is_running() else "start_server"
+        await self._run_server_action(method)
 
-    def action_create_backup(self) -> None:
-        ok, msg = self.server_manager.create_backup()
-        self.notify(msg, severity="information" if ok else "error")
+    async def action_create_backup(self) -> None:
+        await self._run_server_action("create_backup")
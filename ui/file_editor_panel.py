@@ -20,7 +20,9 @@ Keyboard Shortcuts:
 from __future__ import annotations
 
 import os
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -120,6 +122,12 @@ PROPERTY_DESCRIPTIONS: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=32)
+def _search_pattern(query: str, ignore_case: bool = False) -> re.Pattern:
+    """Compile a literal-text search pattern once per query."""
+    return re.compile(re.escape(query), re.IGNORECASE if ignore_case else 0)
+
+
 # ──────────────────────────────────────────────
 #  Confirm Dialog (inline)
 # ──────────────────────────────────────────────
@@ -672,7 +680,8 @@ class FileEditorScreen(Screen):
         ta = self.query_one("#text-editor", TextArea)
         content = ta.text
         query = event.query
-        count = content.lower().count(query.lower())
+        # One pass over the buffer, without a lowercased copy of it
+        count = sum(1 for _ in _search_pattern(query, True).finditer(content))
         if count:
             self.notify(f"Found {count} match(es) for '{query}'")
         else:
@@ -683,8 +692,11 @@ class FileEditorScreen(Screen):
     ) -> None:
         ta = self.query_one("#text-editor", TextArea)
         old = ta.text
-        new = old.replace(event.query, event.replacement)
-        count = old.count(event.query)
+        # Replace and count in one pass. The replacement is literal text,
+        # so backslashes are escaped before re treats them as group refs.
+        new, count = _search_pattern(event.query).subn(
+            event.replacement.replace("\\", "\\\\"), old
+        )
 
         if count:
             ta.load_text(new)
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, DataTable, Input, Label, Static, TabPane
-from ui.widgets import StatusIndicator, ResourceBar, ServerLogView
+from ui.widgets import StatusIndicator, ResourcePanel, ServerLogView
 
 if TYPE_CHECKING:
     from main import MinecraftServerManagerApp
@@ -20,22 +20,27 @@ def build_dashboard(pane: TabPane, app: "MinecraftServerManagerApp") -> None:
 
     mem_card = Vertical(classes="stat-card")
     stats.mount(mem_card)  # Now mount to stats
-    mem_card.mount(Label("—", id="stat-mem-val", classes="stat-value"))
+    # Value labels are kept by reference, so _refresh never queries the DOM
+    mem_val = Label("—", id="stat-mem-val", classes="stat-value")
+    mem_card.mount(mem_val)
     mem_card.mount(Label("Memory", classes="stat-label"))
 
     tps_card = Vertical(classes="stat-card")
     stats.mount(tps_card)
-    tps_card.mount(Label("20.0", id="stat-tps-val", classes="stat-value"))
+    tps_val = Label("20.0", id="stat-tps-val", classes="stat-value")
+    tps_card.mount(tps_val)
     tps_card.mount(Label("TPS", classes="stat-label"))
 
     players_card = Vertical(classes="stat-card")
     stats.mount(players_card)
-    players_card.mount(Label("0", id="stat-players-val", classes="stat-value"))
+    players_val = Label("0", id="stat-players-val", classes="stat-value")
+    players_card.mount(players_val)
     players_card.mount(Label("Players", classes="stat-label"))
 
     uptime_card = Vertical(classes="stat-card")
     stats.mount(uptime_card)
-    uptime_card.mount(Label("—", id="stat-uptime-val", classes="stat-value"))
+    uptime_val = Label("—", id="stat-uptime-val", classes="stat-value")
+    uptime_card.mount(uptime_val)
     uptime_card.mount(Label("Uptime", classes="stat-label"))
 
     # ── Server Controls ──
@@ -54,19 +59,16 @@ def build_dashboard(pane: TabPane, app: "MinecraftServerManagerApp") -> None:
     left = Vertical(id="dash-left")
     main.mount(left)  # Mount to main
     left.mount(Label("📋 Server Console", classes="panel-title"))
-    left.mount(ServerLogView(id="log-view"))
+    log_view = ServerLogView(id="log-view", max_lines=1000)
+    left.mount(log_view)
     left.mount(Input(placeholder="Type server command…", id="cmd-input"))
 
     # Resources
     right = Vertical(id="dash-right")
     main.mount(right)  # Mount to main
     right.mount(Label("📊 System Resources", classes="panel-title"))
-    cpu = ResourceBar(id="cpu-bar")
-    ram = ResourceBar(id="ram-bar")
-    disk = ResourceBar(id="disk-bar")
-    right.mount(cpu)
-    right.mount(ram)
-    right.mount(disk)
+    resources_panel = ResourcePanel(id="resources")
+    right.mount(resources_panel)
     right.mount(Label("", id="uptime-label"))
 
     # Recent actions
@@ -77,14 +79,7 @@ def build_dashboard(pane: TabPane, app: "MinecraftServerManagerApp") -> None:
     # ── Configure after mount ──
     def _post_mount() -> None:
         try:
-            cpu.label = "CPU"
-            cpu.unit = "%"
-            ram.label = "RAM"
-            ram.unit = " MB"
-            disk.label = "Disk"
-            disk.unit = " GB"
-            at = pane.query_one("#actions-table", DataTable)
-            at.add_columns("Time", "Action", "Result")
+            actions_table.add_columns("Time", "Action", "Result")
         except Exception:
             pass
 
@@ -133,9 +128,8 @@ def build_dashboard(pane: TabPane, app: "MinecraftServerManagerApp") -> None:
 
     def _add_action(action: str, result: str) -> None:
         try:
-            t = pane.query_one("#actions-table", DataTable)
             now = datetime.now().strftime("%H:%M:%S")
-            t.add_row(now, action, result[:40])
+            actions_table.add_row(now, action, result[:40])
         except Exception:
             pass
 
@@ -148,26 +142,34 @@ def build_dashboard(pane: TabPane, app: "MinecraftServerManagerApp") -> None:
             status = sm.get_server_status()
             resources = sm.get_system_resources()
 
-            pane.query_one("#stat-mem-val", Label).update(f"{status.ram_used_mb:.0f} MB")
-            pane.query_one("#stat-tps-val", Label).update(f"{status.tps:.1f}")
-            pane.query_one("#stat-players-val", Label).update(str(status.players_online))
+            mem_val.update(f"{status.ram_used_mb:.0f} MB")
+            tps_val.update(f"{status.tps:.1f}")
+            players_val.update(str(status.players_online))
             if status.running:
                 mins = int(status.uptime_seconds // 60)
-                pane.query_one("#stat-uptime-val", Label).update(f"{mins}m")
+                uptime_val.update(f"{mins}m")
             else:
-                pane.query_one("#stat-uptime-val", Label).update("—")
-
-            cpu.value = resources.get("cpu_percent", 0)
-            ram.value = resources.get("ram_used_mb", 0)
-            ram.max_value = resources.get("ram_total_mb", 100)
-            disk.value = resources.get("disk_used_gb", 0)
-            disk.max_value = resources.get("disk_total_gb", 100)
-
-            log_lines = sm.get_recent_logs(50)
-            if log_lines:
-                lv = pane.query_one("#log-view", ServerLogView)
-                lv.load_lines(log_lines)
+                uptime_val.update("—")
+
+            # CPU at display precision, so sampling noise doesn't defeat
+            # the panel's unchanged check
+            resources_panel.update_resources(
+                round(resources.get("cpu_percent", 0)),
+                resources.get("ram_used_mb", 0),
+                resources.get("ram_total_mb", 100),
+                resources.get("disk_used_gb", 0),
+                resources.get("disk_total_gb", 100),
+            )
         except Exception:
             pass
 
     app.set_interval(2.5, _refresh)
+
+    # The console is pushed new output as it is captured, not reloaded
+    # on every tick
+    async def _follow_log() -> None:
+        async for entries in sm.log_stream(backlog=50):
+            if entries:
+                log_view.append_entries(entries)
+
+    pane.run_worker(_follow_log(), group="log-stream", exclusive=True)
@@ -6,6 +6,7 @@ Reusable Textual widgets for the Minecraft Server Manager TUI.
 Provides:
   - StatusIndicator    – colored running/stopped badge
   - ResourceBar        – CPU/RAM/Disk usage bar
+  - ResourcePanel      – CPU, RAM and Disk bars drawn as one widget
   - ServerLogView      – scrolling, color-coded log output
   - ConfirmDialog      – yes/no confirmation modal
   - ProgressIndicator  – download / task progress bar
@@ -24,6 +25,8 @@ from textual.widgets import (
     RichLog,
     Static,
 )
+from rich.progress_bar import ProgressBar as RichProgressBar
+from rich.table import Table
 from rich.text import Text
 
 
@@ -64,6 +67,12 @@ class ResourceBar(Widget):
     max_value: reactive[float] = reactive(100.0)
     unit: reactive[str] = reactive("%")
 
+    def __init__(self, *, label: str = "Resource", unit: str = "%", **kwargs) -> None:
+        super().__init__(**kwargs)
+        # Set before compose() reads them; no watchers to run yet
+        self.set_reactive(ResourceBar.label, label)
+        self.set_reactive(ResourceBar.unit, unit)
+
     def compose(self) -> ComposeResult:
         with Horizontal():
             yield Label(self.label, classes="rb-label")
@@ -81,6 +90,51 @@ class ResourceBar(Widget):
             pass
 
 
+class ResourcePanel(Static):
+    """
+    CPU, RAM and Disk usage bars rendered as a single Rich table.
+
+    One widget and one update per refresh, instead of three ResourceBars
+    with two reactives each.
+    """
+
+    DEFAULT_CSS = """
+    ResourcePanel {
+        height: auto;
+        padding: 0 1;
+    }
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._last: tuple | None = None
+
+    def update_resources(
+        self, cpu: float, ram: float, ram_max: float, disk: float, disk_max: float
+    ) -> None:
+        """Redraw all three bars (skipped when nothing changed)."""
+        values = (cpu, ram, ram_max, disk, disk_max)
+        if values == self._last:
+            return
+        self._last = values
+
+        grid = Table.grid(expand=True, padding=(0, 1))
+        grid.add_column(width=10)
+        grid.add_column(ratio=1)
+        grid.add_column(width=10, justify="right")
+        for label, value, total, unit in (
+            ("CPU", cpu, 100, "%"),
+            ("RAM", ram, ram_max, " MB"),
+            ("Disk", disk, disk_max, " GB"),
+        ):
+            grid.add_row(
+                label,
+                RichProgressBar(total=total or 1, completed=min(value, total)),
+                f"{value:.0f}{unit}",
+            )
+        self.update(grid)
+
+
 # ──────────────────────────────────────────────
 #  Server Log View
 # ──────────────────────────────────────────────
@@ -96,9 +150,19 @@ class ServerLogView(RichLog):
     }
     """
 
-    def add_log_line(self, line: str) -> None:
+    # Styles keyed by the level tags ServerManager assigns on capture
+    LEVEL_STYLES = {
+        "plain":   "dim",
+        "info":    "",
+        "warning": "yellow",
+        "error":   "bold red",
+    }
+
+    def add_log_line(self, line: str, level: str | None = None) -> None:
         """Add a single log line with color coding."""
-        if "[WARN" in line or "WARN" in line.upper()[:30]:
+        if level is not None:
+            self.write(Text(line, style=self.LEVEL_STYLES.get(level, "dim")))
+        elif "[WARN" in line or "WARN" in line.upper()[:30]:
             self.write(Text(line, style="yellow"))
         elif "[ERROR" in line or "ERROR" in line.upper()[:30]:
             self.write(Text(line, style="bold red"))
@@ -113,6 +177,17 @@ class ServerLogView(RichLog):
         for line in lines:
             self.add_log_line(line)
 
+    def append_entries(self, entries: list[tuple[str, str]]) -> None:
+        """Add pre-classified ``(line, level)`` pairs after the existing ones."""
+        for line, level in entries:
+            self.add_log_line(line, level)
+
+    def load_entries(self, entries: list[tuple[str, str]]) -> None:
+        """Load pre-classified ``(line, level)`` pairs at once."""
+        self.clear()
+        for line, level in entries:
+            self.add_log_line(line, level)
+
 
 # ──────────────────────────────────────────────
 #  Confirm Dialog